@@ -4,6 +4,7 @@ import sys
 
 import colorlog
 
+from .commands.compile import command as compile_cmd
 from .commands.lint import command as lint_cmd
 from .commands.stub import command as stub_cmd
 
@@ -29,6 +30,7 @@ def main():
 
     stub_cmd.register(subparsers)
     lint_cmd.register(subparsers)
+    compile_cmd.register(subparsers)
 
     if len(sys.argv) == 1:
         parser.print_help()
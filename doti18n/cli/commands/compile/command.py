@@ -0,0 +1,68 @@
+import logging
+from pathlib import Path
+
+from doti18n import LocaleData
+from doti18n.loaders import D18nLoader, Loader
+
+logger = logging.getLogger("doti18n.compile")
+
+
+def register(subparsers):
+    """Register the 'compile' command to build compiled catalogs."""
+    parser = subparsers.add_parser("compile", help="Compile locales into binary catalogs (.d18n)")
+    parser.add_argument(
+        "path",
+        help="Path to locale's directory",
+        nargs="?",
+    )
+    parser.add_argument("-o", "--output", dest="output", help="Directory to write the catalogs to")
+    parser.add_argument("-l", "--locale", dest="default_locale", default="en", help="Default locale code (default: en)")
+    parser.add_argument(
+        "--compile-plurals",
+        dest="compile_plurals",
+        action="store_true",
+        help="Compile plural dicts into ICU plural messages",
+    )
+    parser.set_defaults(func=handle)
+
+
+def handle(args):
+    """Handle the 'compile' command to build compiled catalogs."""
+    if not args.path:
+        logger.error("No locale's path is provided. Use --help for more information.")
+        exit(1)
+
+    if not args.output:
+        logger.error("No output directory is provided. Use --help for more information.")
+        exit(1)
+
+    path = Path(args.path)
+    output = Path(args.output)
+    if output.resolve() == path.resolve():
+        logger.error("The output directory must differ from the locale's directory.")
+        exit(1)
+
+    loader = Loader(True, compile_plurals=args.compile_plurals)
+    try:
+        i18n = LocaleData(path, args.default_locale, True, loader=loader)
+    except Exception as e:
+        logger.error(f"Failed to load locales from path '{path}': {e}")
+        exit(1)
+
+    output.mkdir(parents=True, exist_ok=True)
+    compiled = 0
+    for locale_code, locale_data in i18n._raw_translations.items():
+        if locale_data is None:
+            continue
+
+        target_path = output / f"{locale_code}{D18nLoader.file_extension}"
+        try:
+            D18nLoader.save(target_path, locale_data)
+        except (TypeError, OSError) as e:
+            logger.error(f"Failed to compile locale '{locale_code}': {e}")
+            exit(1)
+
+        logger.info(f"Compiled locale '{locale_code}' to '{target_path}'.")
+        compiled += 1
+
+    logger.info(f"Compiled {compiled} locales.")
@@ -8,6 +8,7 @@ logger = logging.getLogger("doti18n.stub")
 LIBRARY_CODE_TEMPLATE = """# Generated via doti18n at {time}
 {extra_imports}
 from typing import Any, overload, Optional, Union, Literal, List, Callable, Dict, Tuple, Iterator, SupportsIndex
+from collections.abc import Iterable
 from pathlib import Path
 
 
@@ -39,7 +40,9 @@ class ICUMF:
 
 
 class Loader:
-    def __init__(self, strict: bool = False, icumf: Union[Optional[ICUMF], bool] = None): ...
+    def __init__(self, strict: bool = False, icumf: Union[Optional[ICUMF], bool] = None,
+    compile_plurals: bool = False, stages: Optional[Iterable[str]] = None,
+    hooks: Iterable[Callable[[str, Any], Any]] = ()): ...
     def get_supported_extensions(self) -> Tuple[str]: ...
     def load(self, filepath: Union[str, Path]) -> Union[Dict, List[Tuple[str, dict]]]: ...
 
@@ -49,8 +52,14 @@ class LocaleTranslator:
 
 class LocaleData:
     def __init__(self, path: Union[str, Path], default_locale: str = "en", strict: bool = False, preload: bool = True,
-    loader: Optional[Loader] = None): ...
+    loader: Optional[Loader] = None, workers: Optional[int] = None, executor: str = "thread"): ...
     def __contains__(self, locale_code: str) -> bool: ...
+    def reload(self) -> List[str]: ...
+    def watch(self, interval: float = 1.0) -> None: ...
+    def stop_watching(self) -> None: ...
+    def refresh_index(self) -> List[str]: ...
+    @property
+    def available_locales(self) -> List[str]: ...
     @property
     def loaded_locales(self) -> List[str]: ...
     @overload
@@ -77,6 +86,7 @@ STANDARD_TYPES = frozenset(
         "Dict",
         "Tuple",
         "Iterator",
+        "Iterable",
         "SupportsIndex",
     }
 )
@@ -0,0 +1,207 @@
+import logging
+import threading
+from collections.abc import Hashable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+
+class DottedPath(tuple):
+    """
+    A key path that is joined with dots only when it's printed.
+
+    It's hashable, so it can be used as an aggregation key without building the string.
+    """
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        """Return the dotted path, e.g., 'page.items.0.title'."""
+        return ".".join(map(str, self))
+
+
+@dataclass(frozen=True, slots=True)
+class DiagnosticRecord:
+    """Aggregated events of one (kind, locale, path)."""
+
+    kind: str
+    locale: str | None
+    path: str | None
+    count: int  # How many times the event happened.
+    logged: int  # How many of them were logged.
+    message: str  # The message of the first event.
+
+
+_PLAIN_TYPES = (str, int, float, bool, type(None), DottedPath)
+
+
+def _detach_arg(arg: Any) -> Any:
+    """Return a message argument that doesn't keep user objects alive: plain values as is, others as their text."""
+    if type(arg) in _PLAIN_TYPES:
+        return arg
+    try:
+        return str(arg)
+    except Exception:
+        return object.__repr__(arg)
+
+
+class _Event:
+    __slots__ = ("count", "logged", "msg", "args")
+
+    def __init__(self, msg: str, args: tuple):
+        self.count = 0
+        self.logged = 0
+        self.msg = msg
+        # messages only use `%s`, so the text of an argument formats the same as the argument
+        self.args = tuple(map(_detach_arg, args))
+
+
+@lru_cache(maxsize=256)
+def _get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(name)
+
+
+class Diagnostics:
+    """
+    Central sink for runtime diagnostics: missing keys, locale fallbacks, formatting failures, etc.
+
+    Events are aggregated by (kind, locale, path) with counters. Log records are emitted according
+    to the policy (once per key, or every n-th event), and messages are formatted by `logging`
+    only when a record is actually emitted.
+    """
+
+    def __init__(self, once: bool = True, sample_every: int = 1, max_keys: int = 10_000, enabled: bool = True):
+        """
+        Initialize the diagnostics sink.
+
+        :param once: Log only the first event of each (kind, locale, path).
+        :param sample_every: If `once` is False, log every n-th event of each (kind, locale, path).
+        :param max_keys: Maximum number of distinct keys to track. Beyond it, events are aggregated by kind only.
+        :param enabled: Whether to log events at all. Events are counted either way.
+        """
+        self.once = once
+        self.sample_every = sample_every
+        self.max_keys = max_keys
+        self.enabled = enabled
+        self._events: dict[tuple, _Event] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        once: bool | None = None,
+        sample_every: int | None = None,
+        max_keys: int | None = None,
+        enabled: bool | None = None,
+    ):
+        """Change the logging policy. Arguments that are None are left as is."""
+        if sample_every is not None and sample_every < 1:
+            raise ValueError("sample_every must be a positive integer.")
+
+        if once is not None:
+            self.once = once
+        if sample_every is not None:
+            self.sample_every = sample_every
+        if max_keys is not None:
+            self.max_keys = max_keys
+        if enabled is not None:
+            self.enabled = enabled
+
+    def record(
+        self,
+        kind: str,
+        locale: str | None,
+        path: Hashable,
+        msg: str,
+        *args: Any,
+        source: str | logging.Logger = "doti18n",
+        level: int = logging.WARNING,
+    ):
+        """
+        Count an event and log it if the policy allows.
+
+        :param kind: Event kind, e.g., "missing_key" or "fallback".
+        :param locale: The locale code the event happened in, if any.
+        :param path: The key path (a DottedPath, a string or any hashable) the event is about.
+        :param msg: %-style log message. It's formatted only if the record is emitted.
+        :param args: Arguments for the message.
+        :param source: The logger (or its name) to log with.
+        :param level: The log level.
+        """
+        key = (kind, locale, path)
+        with self._lock:
+            event = self._events.get(key)
+            if event is None and len(self._events) >= self.max_keys:
+                key = (kind, None, None)
+                event = self._events.get(key)
+            if event is not None:
+                event.count += 1
+                count = event.count
+
+        if event is None:
+            # built outside the lock, since converting arguments may run user code that records events too
+            new_event = _Event(msg, args)
+            with self._lock:
+                event = self._events.setdefault(key, new_event)
+                event.count += 1
+                count = event.count
+
+        if not self.enabled:
+            return
+        if count > 1 and (self.once or (count - 1) % self.sample_every):
+            return
+
+        logger = _get_logger(source) if isinstance(source, str) else source
+        if logger.isEnabledFor(level):
+            with self._lock:
+                event.logged += 1
+            logger.log(level, msg, *args)
+
+    def report(self, kind: str | None = None, locale: str | None = None) -> list[DiagnosticRecord]:
+        """
+        Return the aggregated events, most frequent first.
+
+        :param kind: Return only events of this kind.
+        :param locale: Return only events of this locale.
+        :return: List of aggregated records.
+        """
+        with self._lock:
+            items = list(self._events.items())
+
+        records = []
+        for (event_kind, event_locale, path), event in items:
+            if (kind is not None and event_kind != kind) or (locale is not None and event_locale != locale):
+                continue
+
+            try:
+                message = event.msg % event.args if event.args else event.msg
+            except (TypeError, ValueError):
+                message = event.msg
+
+            records.append(
+                DiagnosticRecord(
+                    event_kind,
+                    event_locale,
+                    None if path is None else str(path),
+                    event.count,
+                    event.logged,
+                    message,
+                )
+            )
+
+        records.sort(key=lambda record: record.count, reverse=True)
+        return records
+
+    def reset(self):
+        """Forget all aggregated events, so they are logged again."""
+        with self._lock:
+            self._events.clear()
+
+
+diagnostics = Diagnostics()
+
+__all__ = [
+    "DiagnosticRecord",
+    "Diagnostics",
+    "DottedPath",
+    "diagnostics",
+]
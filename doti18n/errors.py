@@ -44,3 +44,7 @@ class DefaultLocaleNotLoadedError(Doti18nError):
 
     If you have only one locale, you can set it as the default locale.
     """
+
+
+class MacroError(InvalidLocaleDataError):
+    """Exception raised when macros are invalid, e.g., when they reference each other in a cycle."""
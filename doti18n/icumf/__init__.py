@@ -2,20 +2,159 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import datetime, time
+from decimal import Decimal
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Optional
+from string import Formatter
+from typing import TYPE_CHECKING, Any
 
+from ..utils import _NOT_FOUND
 from .formatters import *
 from .nodes import FormatNode, MessageNode, Node, TagNode, TextNode
 from .parser import Parser
+from .segments import RichText, Span, utf16_len
+from .signature import *
 
 if TYPE_CHECKING:
     from doti18n import LocaleTranslator
 
+PLURAL_FORMS = ("zero", "one", "two", "few", "many", "other")
+_TEMPLATE_FIELDS = Formatter()
+# per-formatter caches forget all entries once they hold this many formatters,
+# so formatters created for a single call don't pile up in them
+_MAX_FORMATTERS = 8
+
+
+def _remember(cache: dict, formatter: Any, value: Any):
+    """Store the entry of a formatter in a per-formatter cache, keeping the cache bounded."""
+    if len(cache) >= _MAX_FORMATTERS and formatter not in cache:
+        cache.clear()
+    cache[formatter] = value
+
+
+_COLLECTIONS = (list, tuple, set, frozenset)
+
+
+def _freeze_kwargs(kwargs: dict[str, Any]) -> tuple[tuple[Any, ...], ...]:
+    """
+    Build the render cache key for message arguments.
+
+    Values that compare equal can still render differently (1, 1.0, True and Decimal("1.0")
+    select different plural forms), so anything but str and int is keyed by its type too.
+    Aware datetimes of the same instant are equal in any time zone, so they are keyed by `tzinfo` as well.
+    Lists, tuples and sets are keyed by the types of their items the same way.
+    """
+    frozen: list[tuple[Any, ...]] = []
+    for key, value in sorted(kwargs.items()):
+        kind = type(value)
+        if kind is str or kind is int:
+            frozen.append((key, value))
+        elif kind is float or kind is Decimal:
+            frozen.append((key, value, repr(value)))
+        elif isinstance(value, (datetime, time)):
+            frozen.append((key, value, kind, value.tzinfo))
+        elif kind in _COLLECTIONS:
+            frozen.append((key, value, kind, _freeze_items(value, kind)))
+        else:
+            frozen.append((key, value, kind))
+
+    return tuple(frozen)
+
+
+def _freeze_items(items: Iterable[Any], kind: type) -> tuple | frozenset:
+    """Return what tells the items of a collection apart beyond equality. Sets pair it with the items themselves."""
+    if kind is set or kind is frozenset:
+        return frozenset((item, _item_key(item)) for item in items)
+    return tuple(map(_item_key, items))
+
+
+def _item_key(item: Any) -> Any:
+    kind = type(item)
+    if kind is float or kind is Decimal:
+        return kind, repr(item)
+    elif isinstance(item, (datetime, time)):
+        return kind, item.tzinfo
+    elif kind in _COLLECTIONS:
+        return kind, _freeze_items(item, kind)
+
+    return kind
+
+
+class _FormatterMemo:
+    """
+    Results of a pure formatter, keyed by locale, style, argument value and the policy's key arguments.
+
+    Values are frozen like render cache keys, so datetimes and times are keyed by their time zone too.
+    """
+
+    __slots__ = ("formatter", "maxsize", "key_args", "_results")
+
+    def __init__(self, formatter: BaseFormatter, policy: CachePolicy):
+        """Initialize an empty memo for the formatter."""
+        self.formatter = formatter
+        self.maxsize = policy.maxsize
+        self.key_args = policy.key_args
+        self._results: dict[tuple, Any] = {}
+
+    def __call__(self, t: "LocaleTranslator", node: FormatNode | MessageNode, kwargs: dict[str, Any]) -> Any:
+        """Return the memoized result, formatting the node on a miss."""
+        values = {node.name: kwargs.get(node.name)}
+        for name in self.key_args:
+            if name in kwargs:
+                values[name] = kwargs[name]
+        # equal instants in different zones format differently, `_freeze_kwargs` keys them by tzinfo
+        # sub-messages render their own options, so they are keyed by the node itself
+        key: tuple
+        if isinstance(node, FormatNode):
+            key = (t.locale_code, node.style, node.offset, _freeze_kwargs(values))
+        else:
+            key = (t.locale_code, node, _freeze_kwargs(values))
+
+        try:
+            if (result := self._results.get(key)) is not None:
+                return result
+        except TypeError:
+            # unhashable value
+            return self.formatter(t, node, **kwargs)
+
+        result = self.formatter(t, node, **kwargs)
+        if result:
+            if len(self._results) >= self.maxsize:
+                self._results.clear()
+            self._results[key] = result
+
+        return result
+
+
+class _RenderKey:
+    """
+    Render cache key of a translator.
+
+    Renders only depend on the translator's locale, so they stay cached when a reloaded
+    catalog replaces the translator, as long as the message itself was reused.
+    """
+
+    __slots__ = ("t", "locale_code")
+
+    def __init__(self, t: "LocaleTranslator"):
+        self.t = t
+        self.locale_code = t.locale_code
+
+    def __hash__(self) -> int:
+        return hash(self.locale_code)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _RenderKey) and other.locale_code == self.locale_code
+
 
 class CompiledMessage:
-    """Wrapper for compiled ICUMF expressions."""
+    """
+    Wrapper for compiled ICUMF expressions.
+
+    A compiled message is immutable and may be shared between translators and threads.
+    Use `bind()` to get a callable view for a specific LocaleTranslator.
+    """
 
     def __init__(
         self,
@@ -29,36 +168,158 @@ class CompiledMessage:
         self.raw = raw
         self.formatter = formatter
         self.is_cached = engine.cache_size > 0
-        self.nodes: tuple[Node, ...] | list[Node] = tuple(nodes) if self.is_cached else nodes
-        self.t: Optional[LocaleTranslator] = None
+        self.nodes: tuple[Node, ...] | list[Node] = tuple(nodes) if self.is_cached else list(nodes)
+        self.arg_free = all(
+            isinstance(node, TextNode) or (isinstance(node, TagNode) and node.arg_free) for node in nodes
+        )
+        # Tag formatter -> UTF-8 encoded message, for argument-free messages and a few formatters only.
+        self._encoded: dict = {}
+        # True, if a formatter of the message renders differently over time, so renders are not cached
+        self.is_volatile = engine._is_volatile(nodes)
+        self._signature: MessageSignature | None = None
+
+    @property
+    def signature(self) -> MessageSignature:
+        """Return the arguments and tags of the message. It's extracted on first access."""
+        if self._signature is None:
+            self._signature = extract_signature(self.nodes)
+        return self._signature
+
+    def check(self, formatter: Callable | None = None, /, **kwargs) -> list[str]:
+        """
+        Check message arguments without rendering the message.
 
-    def __call__(self, **kwargs) -> str:
-        """Render the compiled message with the provided keyword arguments."""
-        if not self.t:
-            raise RuntimeError("CompiledMessage is not bound to a LocaleTranslator.")
+        :param formatter: Tag formatter the message will be rendered with. Defaults to the one given at compile time.
+        :param kwargs: Message arguments.
+        :return: List of problems, empty if none were found. See `MessageSignature.check`.
+        """
+        return self.signature.check(kwargs, formatter or self.formatter or self.engine.tag_formatter)
+
+    def render_args(self, t: "LocaleTranslator", /, *args, formatter: Callable | None = None, **kwargs) -> str:
+        """
+        Render the message with positional arguments.
+
+        Positional arguments are mapped onto `signature.names`, which are sorted by name,
+        so the order stays the same across locales that use the same arguments.
+
+        :param t: The translator whose plural and ordinal rules are used.
+        :param args: Message arguments, in `signature.names` order.
+        :param formatter: Tag formatter for this call. Defaults to the one given at compile time.
+        :param kwargs: Other message arguments.
+        :return: The rendered string, or an empty string on failure in non-strict mode.
+        :raises TypeError: If there are too many positional arguments or an argument is given twice.
+        """
+        return self.render(t, formatter, **self.signature.bind_args(args, kwargs))
+
+    def render(self, t: "LocaleTranslator", formatter: Callable | None = None, /, **kwargs) -> str:
+        """
+        Render the compiled message for the given LocaleTranslator.
+
+        :param t: The translator whose plural and ordinal rules are used.
+        :param formatter: Tag formatter for this call. Defaults to the one given at compile time.
+        :param kwargs: Message arguments.
+        :return: The rendered string, or an empty string on failure in non-strict mode.
+        """
+        formatter = formatter or self.formatter
+        if self.engine.check_args and not self._precheck(formatter, kwargs):
+            return ""
         try:
-            if self.is_cached:
-                frozen_kwargs = tuple(sorted(kwargs.items())) if kwargs else tuple()
-                if not isinstance(self.nodes, tuple):
-                    self.nodes = tuple(self.nodes)
-                return self.engine._cached_render(self.t, self.nodes, frozen_kwargs, self.formatter)
-            else:
-                if not isinstance(self.nodes, list):
-                    self.nodes = list(self.nodes)
-                return self.engine._render_nodes(self.t, self.nodes, self.formatter, **kwargs)
+            if self.is_cached and not self.is_volatile:
+                frozen_kwargs = _freeze_kwargs(kwargs) if kwargs else tuple()
+                try:
+                    hash((frozen_kwargs, formatter))
+                except TypeError:
+                    # unhashable arguments (e.g., lists for the `list` formatter) can't be cached
+                    pass
+                else:
+                    nodes = self.nodes if isinstance(self.nodes, tuple) else tuple(self.nodes)
+                    key = getattr(t, "_render_key", None) or _RenderKey(t)
+                    return self.engine._cached_render(key, nodes, frozen_kwargs, formatter)
+
+            return self.engine._render_nodes(t, self.nodes, formatter, **kwargs)
 
         except Exception as e:
-            msg = f"Failed to render ICUMF message: {self.raw!r} with args {kwargs} | Error: {e}"
+            self._report_failure(e, kwargs)
+            return ""
 
-            if self.engine._strict:
-                raise RuntimeError(msg) from None
-            else:
-                self.engine._logger.error(msg)
-                return ""
+    def render_bytes(self, t: "LocaleTranslator", formatter: Callable | None = None, /, **kwargs) -> bytes:
+        """
+        Render the compiled message straight to UTF-8 encoded bytes.
 
-    def bind(self, t: "LocaleTranslator"):
-        """Bind LocaleTranslator to the object."""
-        self.t = t
+        Static text is encoded once and reused, so only the variable parts are
+        encoded per call. Messages without arguments are cached as a whole.
+
+        :param t: The translator whose plural and ordinal rules are used.
+        :param formatter: Tag formatter for this call. Defaults to the one given at compile time.
+        :param kwargs: Message arguments.
+        :return: The rendered bytes, or empty bytes on failure in non-strict mode.
+        """
+        formatter = formatter or self.formatter
+        if self.engine.check_args and not self._precheck(formatter, kwargs):
+            return b""
+        try:
+            if not self.arg_free:
+                return self.engine._render_bytes(t, self.nodes, formatter, **kwargs)
+
+            tag_formatter = formatter or self.engine.tag_formatter
+            if (encoded := self._encoded.get(tag_formatter)) is None:
+                encoded = self.engine._render_bytes(t, self.nodes, formatter)
+                if isinstance(tag_formatter, BaseFormatter) and all(
+                    self.engine._is_static_for(node, tag_formatter) for node in self.nodes
+                ):
+                    _remember(self._encoded, tag_formatter, encoded)
+
+            return encoded
+
+        except Exception as e:
+            self._report_failure(e, kwargs)
+            return b""
+
+    def render_segments(self, t: "LocaleTranslator", formatter: Callable | None = None, /, **kwargs) -> RichText:
+        """
+        Render the message as plain text plus the spans covered by its tags.
+
+        Tags are not rendered by the tag formatter. Instead, each tag becomes a Span
+        with code point and UTF-16 offsets, so rich-text backends (e.g., Telegram
+        entities) don't have to parse markup again. The arguments the formatter's
+        template of a tag references (e.g., `link`) become the attributes of its span.
+
+        :param t: The translator whose plural and ordinal rules are used.
+        :param formatter: Tag formatter whose templates define span attributes.
+                          Defaults to the one given at compile time.
+        :param kwargs: Message arguments.
+        :return: The rendered RichText, or an empty one on failure in non-strict mode.
+        """
+        formatter = formatter or self.formatter
+        if self.engine.check_args and not self._precheck(formatter, kwargs):
+            return RichText("")
+        try:
+            return self.engine._render_segments(t, self.nodes, formatter, **kwargs)
+        except Exception as e:
+            self._report_failure(e, kwargs)
+            return RichText("")
+
+    def _precheck(self, formatter: Callable | None, kwargs: dict) -> bool:
+        if problems := self.signature.check(kwargs, formatter or self.engine.tag_formatter):
+            self._report_failure(TypeError(" ".join(problems)), kwargs)
+            return False
+        return True
+
+    def _report_failure(self, e: Exception, kwargs: dict):
+        msg = f"Failed to render ICUMF message: {self.raw!r} with args {kwargs} | Error: {e}"
+
+        if self.engine._strict:
+            raise RuntimeError(msg) from None
+        else:
+            self.engine._logger.error(msg)
+
+    def __call__(self, **kwargs) -> str:
+        """Raise an error, because an unbound message has no locale rules to render with."""
+        raise RuntimeError("CompiledMessage is not bound to a LocaleTranslator. Use bind() or render() instead.")
+
+    def bind(self, t: "LocaleTranslator") -> "BoundMessage":
+        """Return a view of this message bound to the LocaleTranslator. The message itself is not modified."""
+        return BoundMessage(self, t)
 
     def __repr__(self) -> str:
         """Return a debug representation of the CompiledMessage."""
@@ -69,6 +330,75 @@ class CompiledMessage:
         return self.raw
 
 
+class CompiledPlural(CompiledMessage):
+    """
+    A plural dict (`{one: ..., other: ...}`) compiled into a plural MessageNode.
+
+    It's rendered like an ICU plural message. The original forms are kept, since
+    a missing form falls back to the default locale, and for error reporting.
+    """
+
+    def __init__(self, engine: "ICUMF", node: MessageNode, forms: dict[str, Any], raw: str = ""):
+        """Initialize the CompiledPlural with the engine, the plural node and the original forms."""
+        super().__init__(engine, [node], raw=raw)
+        self.node = node
+        self.forms = forms
+
+
+class BoundMessage:
+    """
+    Callable view pairing a shared CompiledMessage with a LocaleTranslator.
+
+    Views are cheap and are cached by the translator, so accessing the same key
+    again doesn't create a new one.
+    """
+
+    __slots__ = ("message", "t")
+
+    def __init__(self, message: CompiledMessage, t: "LocaleTranslator"):
+        """Initialize the view with the compiled message and the translator to render it with."""
+        self.message = message
+        self.t = t
+
+    def __call__(self, formatter: Callable | None = None, **kwargs) -> str:
+        """Render the message with the provided keyword arguments."""
+        return self.message.render(self.t, formatter, **kwargs)
+
+    def render_bytes(self, formatter: Callable | None = None, **kwargs) -> bytes:
+        """Render the message to UTF-8 encoded bytes. See `CompiledMessage.render_bytes`."""
+        return self.message.render_bytes(self.t, formatter, **kwargs)
+
+    def segments(self, formatter: Callable | None = None, **kwargs) -> RichText:
+        """Render the message as plain text plus tag spans. See `CompiledMessage.render_segments`."""
+        return self.message.render_segments(self.t, formatter, **kwargs)
+
+    def call(self, *args, formatter: Callable | None = None, **kwargs) -> str:
+        """Render the message with positional arguments. See `CompiledMessage.render_args`."""
+        return self.message.render_args(self.t, *args, formatter=formatter, **kwargs)
+
+    def check(self, formatter: Callable | None = None, **kwargs) -> list[str]:
+        """Check message arguments without rendering the message. See `CompiledMessage.check`."""
+        return self.message.check(formatter, **kwargs)
+
+    @property
+    def signature(self) -> MessageSignature:
+        """Return the arguments and tags of the message."""
+        return self.message.signature
+
+    @property
+    def raw(self) -> str:
+        """Return the raw ICUMF string."""
+        return self.message.raw
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the BoundMessage."""
+        return f"<{self.__class__.__name__} raw={self.message.raw!r} locale={self.t.locale_code!r}>"
+
+    def __str__(self) -> str:
+        """Return the raw ICUMF string representation."""
+        return self.message.raw
+
+
 icumf_pattern = re.compile(r"\{\s*\w+\s*,\}")
 html_pattern = re.compile(r"<\s*\w+.*?>")
 
@@ -77,7 +407,13 @@ class ICUMF:
     """Main class for ICUMF formatting."""
 
     def __init__(
-        self, strict: bool = True, tag_formatter: BaseFormatter | None = None, cache_size: int = 1024, **kwargs
+        self,
+        strict: bool = True,
+        tag_formatter: BaseFormatter | None = None,
+        cache_size: int = 1024,
+        formatters: Iterable[str | type[BaseFormatter] | BaseFormatter] | None = None,
+        check_args: bool = False,
+        **kwargs,
     ):
         """
         Initialize the ICUMF formatter with available formatters.
@@ -85,16 +421,20 @@ class ICUMF:
         :param strict: Whether to enforce strict formatting rules.
         :param tag_formatter: The formatter class to use for tags.
         :param cache_size: The size of the cache for rendered entries.
+        :param formatters: Formatters of this instance: names of registered formatters, formatter classes
+                           or instances. If None, all registered formatters are used.
+        :param check_args: Check the arguments against the message signature before every render,
+                           and report problems without rendering.
         :param kwargs: Additional keyword arguments for ICUMF parser configuration.
         """
         self.cache_size = cache_size
-        self.formatters = {}
-        for formatter_name, formatter_cls in BaseFormatter._FORMATTERS.items():
-            self.formatters[formatter_name] = formatter_cls(strict=strict)
-
-        subnumeric_formatters = [name for name, fmt in self.formatters.items() if fmt.is_subnumeric]
-        submussage_formatters = [name for name, fmt in self.formatters.items() if fmt.is_submessage]
-        self.parser = Parser(subnumeric_formatters, submussage_formatters, **kwargs)
+        self.check_args = check_args
+        self._strict = strict
+        self.formatters: dict = {}
+        self._memos: dict[BaseFormatter, _FormatterMemo | None] = {}
+        self.parser = Parser([], [], **kwargs)
+        for fmt in BaseFormatter._FORMATTERS.values() if formatters is None else formatters:
+            self.register_formatter(fmt)
         if tag_formatter:
             if not isinstance(tag_formatter, BaseFormatter):
                 raise TypeError(
@@ -104,18 +444,67 @@ class ICUMF:
         else:
             self.tag_formatter = HTMLFormatter(strict=strict)
 
-        self._strict = strict
         self._logger = logging.getLogger(self.__class__.__name__)
         if cache_size is not None and cache_size > 0:
             self._cached_render = lru_cache(maxsize=cache_size)(self._cached_render_)
 
-    def parse(self, string: str) -> Any:
+    def register_formatter(self, formatter: str | type[BaseFormatter] | BaseFormatter) -> BaseFormatter:
+        """
+        Add a formatter to this instance, replacing any formatter with the same name.
+
+        Only this instance is affected. Register formatters before loading messages,
+        since sub-numeric and sub-message formatters change how messages are parsed.
+
+        :param formatter: The name of a registered formatter, a formatter class or a formatter instance.
+        :return: The registered formatter instance.
+        :raises ValueError: If no formatter is registered under the given name.
+        :raises TypeError: If the formatter is not a BaseFormatter.
+        """
+        if isinstance(formatter, str):
+            if formatter not in BaseFormatter._FORMATTERS:
+                raise ValueError(f"Unknown formatter '{formatter}'.")
+            formatter = BaseFormatter._FORMATTERS[formatter]
+
+        if isinstance(formatter, type) and issubclass(formatter, BaseFormatter):
+            formatter = formatter(strict=self._strict)
+
+        if not isinstance(formatter, BaseFormatter):
+            raise TypeError(f"Formatter must be a BaseFormatter, got {type(formatter).__name__}")
+
+        self.unregister_formatter(formatter.name)
+        self.formatters[formatter.name] = formatter
+        if formatter.is_subnumeric:
+            self.parser.subnumeric_types.append(formatter.name)
+        if formatter.is_submessage:
+            self.parser.submessage_types.append(formatter.name)
+
+        return formatter
+
+    def unregister_formatter(self, name: str) -> BaseFormatter | None:
+        """
+        Remove a formatter from this instance.
+
+        :param name: The formatter name (e.g., "date").
+        :return: The removed formatter, or None if there was none.
+        """
+        formatter: BaseFormatter | None = self.formatters.pop(name, None)
+        if formatter is not None:
+            self._memos.pop(formatter, None)
+        for types in (self.parser.subnumeric_types, self.parser.submessage_types):
+            if name in types:
+                types.remove(name)
+
+        return formatter
+
+    def parse(self, string: str, reuse: Mapping[Any, CompiledMessage] | None = None) -> Any:
         """
         Parse the given string. If it's not in ICUMF format, return it as is.
 
         Forcing ICUMF parsing if the string starts with "icu:".
 
         :param string: The ICUMF formatted string to parse.
+        :param reuse: Previously compiled messages by their raw string. If the string compiles
+                      to one of them, it's returned instead of parsing the string again.
         :return: The parsed representation of the string (or the original string if not ICUMF).
         """
         if not isinstance(string, str):
@@ -128,11 +517,16 @@ class ICUMF:
         # explicit ICUMF
         if string.startswith("icu:"):
             raw_string = string[4:]
+            if reuse and (message := reuse.get(raw_string)) is not None:
+                return message
             return self.compile(self.parser.parse(raw_string), raw=raw_string)
 
         if not (icumf_pattern.search(string) or html_pattern.search(string)):
             return string
 
+        if reuse and (message := reuse.get(string)) is not None:
+            return message
+
         try:
             ast = self.parser.parse(string)
         except Exception as e:
@@ -141,6 +535,65 @@ class ICUMF:
         else:
             return self.compile(ast, raw=string)
 
+    def compile_plural(self, forms: dict[str, Any], name: str = "count") -> CompiledPlural | None:
+        """
+        Compile a plural dict into a plural message, e.g., `{one: "{count} apple", other: "{count} apples"}`.
+
+        Besides CLDR categories, the dict may contain `=N` forms and an integer `offset`.
+        Forms are `str.format` templates: only plain `{name}` placeholders are supported.
+        Other keys are ignored, like in plural dicts that are not compiled.
+
+        :param forms: The plural dict.
+        :param name: The name of the count argument.
+        :return: The compiled plural, or None if the dict can't be compiled (e.g., a form uses a format spec).
+        """
+        if "plural" not in self.formatters:
+            return None
+
+        options: dict[str, list[Node]] = {}
+        offset = 0
+        for key, value in forms.items():
+            if key == "offset":
+                if type(value) is not int or value < 0:
+                    return None
+                offset = value
+            elif key in PLURAL_FORMS or (isinstance(key, str) and key[:1] == "=" and key[1:].isdecimal()):
+                # ICU strings are not templates
+                if not isinstance(value, str) or not isinstance(self.parse(value), str):
+                    return None
+                if (nodes := self._template_nodes(value)) is None:
+                    return None
+                options[key] = nodes
+
+        if not options:
+            return None
+
+        node = MessageNode(name=name, type="plural", options=options, offset=offset)
+        self._compile_nodes([node])
+        prefix = f"offset:{offset} " if offset else ""
+        raw = f"{{{name}, plural, {prefix}{' '.join(f'{key} {{{forms[key]}}}' for key in options)}}}"
+        return CompiledPlural(self, node, forms, raw=raw)
+
+    @staticmethod
+    def _template_nodes(template: str) -> list[Node] | None:
+        """Convert a `str.format` template with plain `{name}` placeholders into nodes."""
+        nodes: list[Node] = []
+        try:
+            fields = list(_TEMPLATE_FIELDS.parse(template))
+        except ValueError:
+            return None
+
+        for literal, field, format_spec, conversion in fields:
+            if literal:
+                nodes.append(TextNode(literal))
+            if field is None:
+                continue
+            if format_spec or conversion or not field.isidentifier():
+                return None
+            nodes.append(FormatNode(name=field))
+
+        return nodes
+
     def get_ast(self, string: str) -> list[Node] | None:
         """
         Parse the input string and returns its corresponding Abstract Syntax Tree (AST).
@@ -173,23 +626,67 @@ class ICUMF:
 
     def compile(self, nodes: list[Node], formatter: BaseFormatter | None = None, raw: str = "") -> CompiledMessage:
         """Compile the parsed nodes into a callable CompiledMessage instance."""
+        self._compile_nodes(nodes)
         return CompiledMessage(self, nodes, raw=raw, formatter=formatter)
 
+    def _compile_nodes(self, nodes: list[Node] | tuple[Node, ...]) -> bool:
+        """
+        Recursively prepare the tree for rendering.
+
+        Builds dispatch tables for every MessageNode and marks tags that don't
+        reference any argument, so they can be rendered once per tag formatter.
+
+        :return: True, if no node in `nodes` references an argument.
+        """
+        arg_free = True
+        for node in nodes:
+            if isinstance(node, MessageNode):
+                node.compile()
+                for branch in node.options.values():
+                    self._compile_nodes(branch)
+                arg_free = False
+            elif isinstance(node, TagNode):
+                node.arg_free = self._compile_nodes(node.children)
+                node.rendered.clear()
+                node.encoded.clear()
+                arg_free = arg_free and node.arg_free
+            elif isinstance(node, FormatNode):
+                arg_free = False
+
+        return arg_free
+
+    def _is_volatile(self, nodes: Iterable[Node]) -> bool:
+        """Tell whether some node is formatted by a formatter whose output changes over time."""
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (FormatNode, MessageNode)):
+                if getattr(self.formatters.get(node.type), "is_volatile", False):
+                    return True
+                if isinstance(node, MessageNode):
+                    for branch in node.options.values():
+                        stack.extend(branch)
+            elif isinstance(node, TagNode):
+                stack.extend(node.children)
+
+        return False
+
     def _cached_render_(
         self,
-        t: "LocaleTranslator",
+        key: _RenderKey,
         nodes: tuple[Node, ...],
-        frozen_kwargs: tuple[tuple[str, Any], ...],
+        frozen_kwargs: tuple[tuple[Any, ...], ...],
         formatter: Callable | None = None,
     ) -> str:
-        kwargs = dict(frozen_kwargs)
-        return self._render_nodes(t, list(nodes), formatter, **kwargs)
+        kwargs = {item[0]: item[1] for item in frozen_kwargs}
+        return self._render_nodes(key.t, list(nodes), formatter, **kwargs)
 
     def _render_nodes(
         self,
         t: "LocaleTranslator",
         nodes: list[Node] | tuple[Node, ...],
         formatter: Callable | None = None,
+        /,
         **kwargs,
     ) -> str:
         text = []
@@ -199,20 +696,7 @@ class ICUMF:
                 continue
 
             elif isinstance(node, (FormatNode, MessageNode)):
-                if not (fmt := self.formatters.get(node.type)):
-                    if isinstance(node, FormatNode) and not node.style:
-                        # treat as simple variable replacement
-                        value = kwargs.get(node.name, "")
-                        text.append(str(value))
-                        continue
-
-                    self._throw(
-                        f"Unknown formatter '{node.type}'.",
-                        ValueError,
-                    )
-                    continue
-
-                result = fmt(t, node, **kwargs)
+                result = self._format_node(t, node, kwargs)
                 if isinstance(result, list):
                     text.append(self._render_nodes(t, result, formatter, **kwargs))
                 else:
@@ -221,6 +705,20 @@ class ICUMF:
 
             elif isinstance(node, TagNode):
                 tag_formatter = formatter or self.tag_formatter
+                if (
+                    node.arg_free
+                    and isinstance(tag_formatter, BaseFormatter)
+                    and (static := self._render_static_tag(t, node, tag_formatter)) is not None
+                ):
+                    text.append(static)
+                    continue
+
+                if isinstance(tag_formatter, TagFormatter) and (template := tag_formatter.static_template(node)):
+                    text.append(template.prefix)
+                    text.append(self._render_nodes(t, node.children, formatter, **kwargs))
+                    text.append(template.suffix)
+                    continue
+
                 result = tag_formatter(t, node, **kwargs)
                 if isinstance(result, list):
                     text.append(self._render_nodes(t, result, formatter, **kwargs))
@@ -230,6 +728,180 @@ class ICUMF:
 
         return "".join(text)
 
+    def _render_bytes(
+        self,
+        t: "LocaleTranslator",
+        nodes: Sequence[Node | None],
+        formatter: Callable | None = None,
+        /,
+        **kwargs,
+    ) -> bytes:
+        parts = []
+        for node in nodes:
+            if isinstance(node, TextNode):
+                if (encoded := node.encoded) is None:
+                    encoded = node.encoded = node.value.encode("utf-8")
+                parts.append(encoded)
+
+            elif isinstance(node, (FormatNode, MessageNode)):
+                result = self._format_node(t, node, kwargs)
+                if isinstance(result, list):
+                    parts.append(self._render_bytes(t, result, formatter, **kwargs))
+                else:
+                    parts.append(str(result).encode("utf-8"))
+
+            elif isinstance(node, TagNode):
+                tag_formatter = formatter or self.tag_formatter
+                if (
+                    node.arg_free
+                    and isinstance(tag_formatter, BaseFormatter)
+                    and (static := self._encode_static_tag(t, node, tag_formatter)) is not None
+                ):
+                    parts.append(static)
+                    continue
+
+                if isinstance(tag_formatter, TagFormatter) and (template := tag_formatter.static_template(node)):
+                    parts.append(template.prefix_bytes)
+                    parts.append(self._render_bytes(t, node.children, formatter, **kwargs))
+                    parts.append(template.suffix_bytes)
+                    continue
+
+                result = tag_formatter(t, node, **kwargs)
+                if isinstance(result, list):
+                    parts.append(self._render_bytes(t, result, formatter, **kwargs))
+                else:
+                    parts.append(str(result).encode("utf-8"))
+
+        return b"".join(parts)
+
+    def _render_segments(
+        self,
+        t: "LocaleTranslator",
+        nodes: list[Node] | tuple[Node, ...],
+        formatter: Callable | None = None,
+        /,
+        **kwargs,
+    ) -> RichText:
+        parts: list[str] = []
+        spans: list[Span | None] = []
+        self._walk_segments(t, nodes, kwargs, formatter or self.tag_formatter, parts, spans, [0, 0], 0)
+        return RichText("".join(parts), tuple(span for span in spans if span is not None))
+
+    def _walk_segments(
+        self,
+        t: "LocaleTranslator",
+        nodes: Sequence[Node | None],
+        kwargs: dict[str, Any],
+        tag_formatter: Callable,
+        parts: list[str],
+        spans: list[Span | None],
+        position: list[int],
+        depth: int,
+    ):
+        """Render nodes into `parts`, tracking the code point and UTF-16 `position` for tag spans."""
+        for node in nodes:
+            if isinstance(node, TextNode):
+                self._push_text(node.value, parts, position)
+
+            elif isinstance(node, (FormatNode, MessageNode)):
+                result = self._format_node(t, node, kwargs)
+                if isinstance(result, list):
+                    self._walk_segments(t, result, kwargs, tag_formatter, parts, spans, position, depth)
+                else:
+                    self._push_text(str(result), parts, position)
+
+            elif isinstance(node, TagNode):
+                # reserve the slot, so spans stay in opening order
+                index = len(spans)
+                spans.append(None)
+                start, start_utf16 = position
+                self._walk_segments(t, node.children, kwargs, tag_formatter, parts, spans, position, depth + 1)
+                attrs = self._span_attrs(tag_formatter, node, kwargs)
+                spans[index] = Span(
+                    node.name, start, position[0] - start, start_utf16, position[1] - start_utf16, attrs, depth
+                )
+
+    @staticmethod
+    def _span_attrs(tag_formatter: Callable, node: TagNode, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Return the arguments the tag's template references, e.g., `{"link": ...}` for `<a href="{link}">`."""
+        if not isinstance(tag_formatter, TagFormatter) or (template := tag_formatter.get_template(node.name)) is None:
+            return {}
+
+        return {name: kwargs[name] for name in template.required if name in kwargs}
+
+    @staticmethod
+    def _push_text(value: str, parts: list[str], position: list[int]):
+        parts.append(value)
+        position[0] += len(value)
+        position[1] += utf16_len(value)
+
+    def _format_node(self, t: "LocaleTranslator", node: FormatNode | MessageNode, kwargs: dict[str, Any]) -> Any:
+        if not (fmt := self.formatters.get(node.type)):
+            if isinstance(node, FormatNode) and not node.style:
+                # treat as simple variable replacement
+                return str(kwargs.get(node.name, ""))
+
+            return self._throw(f"Unknown formatter '{node.type}'.", ValueError)
+
+        try:
+            memo = self._memos[fmt]
+        except KeyError:
+            # formatters may also be replaced directly in `self.formatters`, so memos are keyed by instance
+            memo = self._memos.setdefault(fmt, self._make_memo(fmt))
+        if memo is not None:
+            return memo(t, node, kwargs)
+
+        return fmt(t, node, **kwargs)
+
+    @staticmethod
+    def _make_memo(fmt: Callable) -> _FormatterMemo | None:
+        policy = getattr(fmt, "cache_policy", None)
+        if getattr(fmt, "is_pure", False) and isinstance(policy, CachePolicy) and policy.maxsize > 0:
+            return _FormatterMemo(fmt, policy)  # type: ignore[arg-type]
+
+        return None
+
+    def _render_static_tag(self, t: "LocaleTranslator", node: TagNode, tag_formatter: BaseFormatter) -> str | None:
+        """Render an argument-free tag once for `tag_formatter` and remember the result."""
+        # a single lookup, since the cache may be cleared by another thread in between
+        cached: str | None = node.rendered.get(tag_formatter, _NOT_FOUND)
+        if cached is not _NOT_FOUND:
+            return cached
+
+        if not self._is_static_for(node, tag_formatter):
+            _remember(node.rendered, tag_formatter, None)
+            return None
+
+        result = tag_formatter(t, node)
+        if isinstance(result, list):
+            rendered = self._render_nodes(t, result, tag_formatter)
+        else:
+            rendered = str(result)
+
+        _remember(node.rendered, tag_formatter, rendered)
+        return rendered
+
+    def _encode_static_tag(self, t: "LocaleTranslator", node: TagNode, tag_formatter: BaseFormatter) -> bytes | None:
+        """Encode an argument-free tag once for `tag_formatter` and remember the result."""
+        encoded: bytes | None = node.encoded.get(tag_formatter)
+        if encoded is not None:
+            return encoded
+
+        if (static := self._render_static_tag(t, node, tag_formatter)) is None:
+            return None
+
+        encoded = static.encode("utf-8")
+        _remember(node.encoded, tag_formatter, encoded)
+        return encoded
+
+    def _is_static_for(self, node: Node, tag_formatter: BaseFormatter) -> bool:
+        if isinstance(node, TagNode):
+            return tag_formatter.is_static(node) and all(
+                self._is_static_for(child, tag_formatter) for child in node.children
+            )
+
+        return isinstance(node, TextNode)
+
     def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR):
         if self._strict:
             raise exc_type(msg)
@@ -1,14 +1,21 @@
-from .base import BaseFormatter
+from .base import BaseFormatter, CachePolicy
 from .count import CountFormatter
-from .date import DateFormatter
+from .date import DateFormatter, DatetimeFormatter, TimeFormatter
 from .html import HTMLFormatter
+from .list import ListFormatter
 from .markdown import MarkdownFormatter
+from .number import NumberFormatter
 from .plural import PluralFormatter
+from .relativetime import DurationFormatter, RelativeTimeFormatter
 from .select import SelectFormatter
 from .selectordinal import SelectordinalFormatter
+from .tags import TagFormatter, TagTemplate
 
 __all__ = [
     "BaseFormatter",
+    "CachePolicy",
+    "TagFormatter",
+    "TagTemplate",
     "HTMLFormatter",
     "MarkdownFormatter",
     "CountFormatter",
@@ -16,4 +23,10 @@ __all__ = [
     "SelectFormatter",
     "SelectordinalFormatter",
     "DateFormatter",
+    "TimeFormatter",
+    "DatetimeFormatter",
+    "NumberFormatter",
+    "RelativeTimeFormatter",
+    "DurationFormatter",
+    "ListFormatter",
 ]
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from ..nodes import Node
@@ -8,6 +9,20 @@ if TYPE_CHECKING:
     from doti18n import LocaleTranslator
 
 
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """
+    How the ICUMF engine memoizes the results of a pure formatter.
+
+    Results are keyed by the locale, the node style, the argument value (with its time zone, for datetimes
+    and times) and the values of `key_args`.
+    When the cache is full, it is cleared.
+    """
+
+    maxsize: int = 1024
+    key_args: tuple[str, ...] = ()  # other message arguments the output depends on (e.g., `tzinfo`)
+
+
 class BaseFormatter(ABC):
     """Base class for formatters."""
 
@@ -15,6 +30,13 @@ class BaseFormatter(ABC):
     name: str = "base"
     is_subnumeric = False
     is_submessage = False
+    # True, if the output depends only on the locale, the node style and the argument value
+    # (plus `cache_policy.key_args`). Pure formatters with a cache policy are memoized by the engine.
+    is_pure = False
+    cache_policy: CachePolicy | None = None
+    # True, if the output changes over time for the same arguments (e.g., "5 minutes ago").
+    # Messages that use such a formatter are never served from the render cache.
+    is_volatile = False
 
     @abstractmethod
     def __init__(self, strict: bool):
@@ -26,7 +48,7 @@ class BaseFormatter(ABC):
         self.strict = strict
 
     @abstractmethod
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
         """
         Format a message with the given variables.
 
@@ -37,9 +59,22 @@ class BaseFormatter(ABC):
         """
         raise NotImplementedError
 
+    def is_static(self, node: Node) -> bool:
+        """
+        Tell whether the output for `node` depends on nothing but the node itself.
+
+        Tag formatters return True for tags they render without looking at
+        the arguments or the translator, so argument-free tags can be rendered
+        once and reused. The default is the safe answer: False.
+
+        :param node: The node to check.
+        :return: True, if the rendered node can be cached.
+        """
+        return False
+
     def __init_subclass__(cls, **kwargs):
-        """Register subclasses based on their formatter names."""
+        """Register subclasses that declare their own formatter name."""
         super().__init_subclass__()
 
-        if hasattr(cls, "name"):
+        if "name" in cls.__dict__:
             BaseFormatter._FORMATTERS[cls.name] = cls
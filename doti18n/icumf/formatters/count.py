@@ -1,9 +1,14 @@
 import logging
 from collections.abc import Sequence
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from babel.core import UnknownLocaleError
+
+from ...utils import _plural_operand
 from ..nodes import FormatNode, Node, TextNode
-from . import BaseFormatter
+from . import BaseFormatter, CachePolicy
+from .number import compile_number_format
 
 if TYPE_CHECKING:
     from doti18n import LocaleTranslator
@@ -16,28 +21,60 @@ class CountFormatter(BaseFormatter):
     This formatter handles the insertion of counts into messages.
     Example: You have # new messages.
 
+    Numeric counts are formatted with the locale's decimal format (e.g., 1,000 in English).
+    Fractional counts keep their visible fraction digits (1.0, Decimal("2.50"), "2.50").
+
     If no count is provided, it raises an error or logs a warning based on the strict mode.
     """
 
     name = "count"
     is_subnumeric = True
     is_submessage = False
+    is_pure = True
+    cache_policy = CachePolicy(maxsize=2048)
 
     def __init__(self, strict: bool):
         """Initialize the count formatter."""
         self._strict = strict
         self._logger = logging.getLogger(self.__class__.__name__)
 
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
         """Format a hash (#) inside messages."""
         if not isinstance(node, FormatNode):
             raise TypeError("CountFormatter can only process FormatNode instances.")
 
         count = kwargs.get(node.name, "")
-        if not count and self._strict:
+        if (count is None or count == "") and self._strict:
             raise ValueError(f"No value provided for '{node.name}'.")
 
+        # numeric strings are formatted like the numbers they select the plural form for
+        if isinstance(count, str):
+            try:
+                count = _plural_operand(count)
+            except ValueError:
+                pass
+
+        if isinstance(count, (int, float, Decimal)) and not isinstance(count, bool):
+            if node.offset:
+                count = count - node.offset
+            try:
+                return [TextNode(self._format_number(t.locale_code, count))]
+            except (ValueError, UnknownLocaleError) as e:
+                self._logger.warning("Failed to format count for '%s' with locale rules: %s", node.name, e)
+
         if not isinstance(count, str):
             count = str(count)
 
         return [TextNode(count)]
+
+    @staticmethod
+    def _format_number(locale_code: str, count: int | float | Decimal) -> str:
+        if type(count) is int:
+            return compile_number_format(locale_code).format(count)
+
+        # show the same fraction digits the plural form was selected for, e.g., "1.0 hours" or "2.50 km"
+        operand = _plural_operand(count)
+        exponent = operand.as_tuple().exponent if isinstance(operand, Decimal) else 0
+        digits = -exponent if isinstance(exponent, int) and exponent < 0 else 0
+        style = f"::.{'0' * digits}" if digits else None
+        return compile_number_format(locale_code, style).format(operand)
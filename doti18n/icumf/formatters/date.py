@@ -1,42 +1,170 @@
 import logging
 from collections.abc import Sequence
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import UTC, date, datetime, time, tzinfo
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
+
+from babel import Locale
+from babel.core import UnknownLocaleError
+from babel.dates import DateTimePattern, match_skeleton, parse_pattern, tokenize_pattern
 
 from ..nodes import FormatNode, Node, TextNode
-from . import BaseFormatter
+from . import BaseFormatter, CachePolicy
 
 if TYPE_CHECKING:
     from doti18n import LocaleTranslator
 
+CLDR_STYLES = ("short", "medium", "long", "full")
+DEFAULT_STYLE = "medium"
+TIME_FIELDS = frozenset("aBbhHKkmsSAzZOvVXx")
+
+
+class CompiledDateFormat:
+    """
+    A date/time pattern resolved for one locale, style and timezone.
+
+    Keeps a small memo of recently formatted values, since feeds often render
+    many items with the same date.
+    """
+
+    __slots__ = ("pattern", "locale", "tz", "_date_only", "_memo")
+
+    def __init__(self, pattern: DateTimePattern | str, locale: Locale, kind: str, tz: tzinfo | None, memo_size: int):
+        """Initialize the compiled format. `pattern` is a CLDR pattern or a strftime() string."""
+        self.pattern = pattern
+        self.locale = locale
+        self.tz = tz
+        self._date_only = kind == "date" and isinstance(pattern, DateTimePattern) and not _has_time_fields(pattern)
+        self._memo = lru_cache(maxsize=memo_size)(self._apply)
+
+    def format(self, value: datetime | date | time) -> str:
+        """
+        Format the value.
+
+        Aware datetimes are converted to the timezone of this format, naive ones are assumed to be in it.
+        """
+        if isinstance(value, datetime):
+            if self.tz is not None:
+                value = value.astimezone(self.tz) if value.tzinfo else value.replace(tzinfo=self.tz)
+            if self._date_only:
+                return self._memo(value.date(), None)
+
+            # aware datetimes with equal instants compare equal, so the zone is a part of the key
+            return self._memo(value, value.tzinfo)
+
+        return self._memo(value, None)
+
+    def _apply(self, value: datetime | date | time, _zone: tzinfo | None) -> str:
+        if isinstance(self.pattern, str):
+            return value.strftime(self.pattern)
+
+        result: str = self.pattern.apply(value, self.locale)
+        return result
+
+
+def _has_time_fields(pattern: DateTimePattern) -> bool:
+    return any(kind == "field" and value[0] in TIME_FIELDS for kind, value in tokenize_pattern(pattern.pattern))
+
+
+@lru_cache(maxsize=512)
+def _get_zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _resolve_pattern(locale: Locale, kind: str, style: str) -> DateTimePattern | str:
+    pattern: DateTimePattern
+    if style in CLDR_STYLES:
+        if kind == "date":
+            pattern = locale.date_formats[style]
+        elif kind == "time":
+            pattern = locale.time_formats[style]
+        else:
+            pattern = parse_pattern(
+                locale.datetime_formats[style]
+                .replace("{0}", locale.time_formats[style].pattern)
+                .replace("{1}", locale.date_formats[style].pattern)
+            )
+        return pattern
+
+    if style.startswith("::"):
+        skeleton = style[2:].strip()
+        if not (matched := match_skeleton(skeleton, locale.datetime_skeletons)):
+            raise ValueError(f"No pattern matches date skeleton '{skeleton}'.")
+        pattern = locale.datetime_skeletons[matched]
+        return pattern
+
+    if "%" in style:
+        # strftime() pattern, kept for backward compatibility
+        return style
+
+    return parse_pattern(style)
+
+
+@lru_cache(maxsize=1024)
+def compile_date_format(
+    locale_code: str, kind: str = "date", style: str | None = None, tz: tzinfo | None = None, memo_size: int = 256
+) -> CompiledDateFormat:
+    """
+    Resolve the date/time pattern for a locale, style and timezone.
+
+    Results are cached and shared between all formatters.
+
+    :param locale_code: The locale code (e.g., 'en', 'pt-BR').
+    :param kind: `date`, `time` or `datetime`.
+    :param style: `short`, `medium`, `long`, `full`, an ICU skeleton starting with `::` (e.g., `::yMMMd`),
+                  a CLDR pattern (e.g., `dd.MM.yyyy`), a strftime() pattern or None for `medium`.
+    :param tz: The timezone to render values in. If None, values are rendered as given.
+    :param memo_size: How many recently formatted values to remember.
+    :return: The compiled date format.
+    :raises ValueError: If the locale or the style is invalid.
+    """
+    locale = Locale.parse(locale_code.replace("-", "_"))
+    pattern = _resolve_pattern(locale, kind, style or DEFAULT_STYLE)
+    return CompiledDateFormat(pattern, locale, kind, tz, memo_size)
+
 
 class DateFormatter(BaseFormatter):
     """
     Formatter for date messages.
 
-    Date messages allow for formatting dates based on a given key.
-    Example: {date, date, short} or {date, date, long} or {date, date, %d.%m.%Y}.
+    Date messages format dates with the locale's CLDR patterns.
+    Example: {date, date, short}, {date, date, long}, {date, date, ::yMMMd} or {date, date, dd.MM.yyyy}.
+
+    Values can be datetime/date objects, Unix timestamps or ISO 8601 strings.
+    Timestamps are instants and are rendered in the formatter's timezone (UTC by default).
+    The timezone can be set per formatter or per call with the `tzinfo` keyword argument
+    (a `zoneinfo.ZoneInfo` or an IANA name like "Europe/Berlin").
 
-    If style is not provided, it falls back to a default format.
+    If style is not provided, it falls back to the `medium` style.
     """
 
     name = "date"
     is_subnumeric = False
     is_submessage = False
-    style = {
-        "short": "%d.%m.%Y",
-        "long": "%d.%m.%Y %H:%M:%S",
-    }
+    is_pure = True
+    cache_policy = CachePolicy(maxsize=1024, key_args=("tzinfo",))
 
-    def __init__(self, strict: bool):
-        """Initialize the date formatter."""
+    def __init__(self, strict: bool, timezone: tzinfo | str | None = None):
+        """
+        Initialize the date formatter.
+
+        :param strict: Whether to enforce strict formatting rules.
+        :param timezone: Default timezone to render values in.
+        """
         self._strict = strict
         self._logger = logging.getLogger(self.__class__.__name__)
+        self.timezone = _get_zone(timezone) if isinstance(timezone, str) else timezone
 
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
         """Format a date message."""
         if not isinstance(node, FormatNode):
-            raise TypeError("DateFormatter can only process FormatNode instances.")
+            raise TypeError(f"{self.__class__.__name__} can only process FormatNode instances.")
 
         value = kwargs.get(node.name)
         if value is None:
@@ -44,33 +172,29 @@ class DateFormatter(BaseFormatter):
                 f"No date value provided for '{node.name}'.",
                 ValueError,
             )
-        if isinstance(value, int):
-            date = datetime.fromtimestamp(value)
-        elif isinstance(value, float):
-            date = datetime.fromtimestamp(int(value))
-        elif isinstance(value, str):
-            try:
-                date = datetime.fromisoformat(value)
-            except ValueError as e:
-                return self._throw(
-                    f"Invalid date string provided for '{node.name}': {e}",
-                    ValueError,
-                )
-        elif isinstance(value, datetime):
-            date = value
-        else:
-            return self._throw(
-                f"Unsupported date value type for '{node.name}': {type(value)}",
-                TypeError,
-            )
 
-        # if cant get style, use the raw value
-        if not node.style:
-            style = self.style["short"]
-        else:
-            style = self.style.get(node.style, self.style["short"])
+        try:
+            tz = kwargs.get("tzinfo", self.timezone)
+            if isinstance(tz, str):
+                tz = _get_zone(tz)
+
+            value = self._to_datetime(value, tz)
+            date_format = compile_date_format(t.locale_code, self.name, node.style or None, tz)
+        except (ValueError, TypeError, KeyError, UnknownLocaleError) as e:
+            return self._throw(f"Cannot format '{node.name}' as {self.name}: {e}", type(e))
+
+        return [TextNode(date_format.format(value))]
 
-        return [TextNode(date.strftime(style))]
+    @staticmethod
+    def _to_datetime(value: Any, tz: tzinfo | None) -> datetime | date | time:
+        if isinstance(value, (datetime, date, time)):
+            return value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return datetime.fromtimestamp(value, tz or UTC)
+        if isinstance(value, str):
+            return _parse_iso(value)
+
+        raise TypeError(f"Unsupported date value type: {type(value).__name__}")
 
     def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
         if self._strict:
@@ -78,3 +202,23 @@ class DateFormatter(BaseFormatter):
         else:
             self._logger.log(lvl, msg)
             return []
+
+
+class TimeFormatter(DateFormatter):
+    """
+    Formatter for time messages.
+
+    Example: {start, time, short} or {start, time, ::Hm}.
+    """
+
+    name = "time"
+
+
+class DatetimeFormatter(DateFormatter):
+    """
+    Formatter for combined date and time messages.
+
+    Example: {sent, datetime, medium} or {sent, datetime, ::yMMMdHm}.
+    """
+
+    name = "datetime"
@@ -1,51 +1,21 @@
-import logging
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from .tags import TagFormatter, TagTemplate
 
-from ..nodes import Node, TagNode, TextNode
-from . import BaseFormatter
 
-if TYPE_CHECKING:
-    from doti18n import LocaleTranslator
-
-
-class HTMLFormatter(BaseFormatter):
+class HTMLFormatter(TagFormatter):
     """
     Formatter for HTML tags inside messages.
 
     This formatter handles the conversion of certain tags to their HTML equivalents.
     Example: <link> becomes <a href="..."></a>.
 
-    If an unsupported tag is encountered, it raises an error or logs a warning based on the strict mode.
+    Other tags are rendered as they are, e.g., <b>text</b>.
     """
 
     name = "html"
+    tags = {
+        "link": ('<a href="{link}">', "</a>"),
+    }
 
-    def __init__(self, strict: bool):
-        """Initialize the HTMLFormatter."""
-        self._strict = strict
-        self._logger = logging.getLogger(self.__class__.__name__)
-
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
-        """Format tags inside messages."""
-        if not isinstance(node, TagNode):
-            raise TypeError("HTMLFormatter can only process TagNode instances.")
-
-        if node.name == "link":
-            if not (link := kwargs.get("link")):
-                return self._throw(
-                    "No 'link' value provided for 'link' tag.",
-                    ValueError,
-                )
-
-            return [TextNode(f'<a href="{link}">'), *node.children, TextNode("</a>")]
-
-        else:
-            return [TextNode(f"<{node.name}>"), *node.children, TextNode(f"</{node.name}>")]
-
-    def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
-        if self._strict:
-            raise exc_type(msg)
-        else:
-            self._logger.log(lvl, msg)
-            return []
+    def default_template(self, name: str) -> TagTemplate | None:
+        """Render unknown tags as HTML elements of the same name."""
+        return TagTemplate(f"<{name}>", f"</{name}>")
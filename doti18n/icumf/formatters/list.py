@@ -0,0 +1,178 @@
+import logging
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from babel import Locale
+from babel.core import UnknownLocaleError
+
+from ..nodes import FormatNode, Node, TextNode
+from . import BaseFormatter, CachePolicy
+
+if TYPE_CHECKING:
+    from doti18n import LocaleTranslator
+
+# ICU list types -> CLDR list pattern names
+LIST_TYPES = {"conjunction": "standard", "disjunction": "or", "unit": "unit"}
+LIST_WIDTHS = ("", "-short", "-narrow")
+DEFAULT_TYPE = "conjunction"
+LIST_KEYS = ("start", "middle", "end", "2")
+# CLDR list pattern name -> the names it inherits missing patterns from, in order (aliases of CLDR root, as in Babel)
+LIST_FALLBACKS = {
+    "standard-short": ("standard",),
+    "standard-narrow": ("standard-short", "standard"),
+    "or-short": ("or",),
+    "or-narrow": ("or-short", "or"),
+    "unit": ("unit-short", "standard"),
+    "unit-short": ("standard",),
+    "unit-narrow": ("unit-short", "unit", "standard"),
+}
+
+
+class _Pattern:
+    """A `{0}...{1}` list pattern split into its literal parts."""
+
+    __slots__ = ("prefix", "infix", "suffix")
+
+    def __init__(self, pattern: str):
+        """Split the pattern around its placeholders."""
+        first, second = pattern.find("{0}"), pattern.find("{1}")
+        if first < 0 or second < first:
+            raise ValueError(f"Unsupported list pattern '{pattern}'.")
+
+        self.prefix = pattern[:first]
+        self.infix = pattern[first + 3 : second]
+        self.suffix = pattern[second + 3 :]
+
+
+class CompiledListFormat:
+    """
+    The list patterns of one locale and style, split once.
+
+    Babel formats long lists by applying the middle pattern again to the
+    whole intermediate result. Since each pattern wraps its arguments in fixed
+    literals, the same output is built here in a single join.
+    """
+
+    __slots__ = ("start", "middle", "end", "pair")
+
+    def __init__(self, patterns: dict[str, str]):
+        """Split the `start`, `middle`, `end` and `2` patterns."""
+        self.start = _Pattern(patterns["start"])
+        self.middle = _Pattern(patterns["middle"])
+        self.end = _Pattern(patterns["end"])
+        self.pair = _Pattern(patterns["2"])
+
+    def format(self, items: Sequence[str]) -> str:
+        """Join the items using the list patterns."""
+        count = len(items)
+        if count < 2:
+            return items[0] if count else ""
+        if count == 2:
+            pair = self.pair
+            return f"{pair.prefix}{items[0]}{pair.infix}{items[1]}{pair.suffix}"
+
+        start, middle, end = self.start, self.middle, self.end
+        parts = [end.prefix, middle.prefix * (count - 3), start.prefix, items[0], start.infix, items[1], start.suffix]
+        if count > 3:
+            # every middle item is followed by the suffix of its own pattern, then by the infix of the next one
+            glue = f"{middle.suffix}{middle.infix}"
+            parts.append(middle.infix)
+            parts.append(glue.join(items[2:-1]))
+            parts.append(middle.suffix)
+
+        parts += [end.infix, items[-1], end.suffix]
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def compile_list_format(locale_code: str, style: str | None = None) -> CompiledListFormat:
+    """
+    Resolve the list patterns for a locale and style.
+
+    Results are cached and shared between all formatters.
+
+    :param locale_code: The locale code (e.g., 'en', 'pt-BR').
+    :param style: `conjunction` ("a, b, and c"), `disjunction` ("a, b, or c") or `unit` ("a, b, c"),
+                  optionally followed by a width: `short` or `narrow` (e.g., `unit-narrow` or `unit narrow`).
+                  None means `conjunction`.
+    :return: The compiled list format.
+    :raises ValueError: If the locale or the style is invalid.
+    """
+    list_type, _, width = (style or DEFAULT_TYPE).strip().replace(" ", "-").partition("-")
+    if list_type not in LIST_TYPES or (width and f"-{width}" not in LIST_WIDTHS):
+        raise ValueError(f"Unsupported list style '{style}'.")
+
+    locale = Locale.parse(locale_code.replace("-", "_"))
+    name = f"{LIST_TYPES[list_type]}-{width}" if width else LIST_TYPES[list_type]
+    # locales often define only some patterns of a width, each one is inherited on its own
+    chain = [
+        locale.list_patterns.get(candidate) or {} for candidate in (name, *LIST_FALLBACKS.get(name, ()), "standard")
+    ]
+    patterns = {}
+    for key in LIST_KEYS:
+        pattern = next((candidate[key] for candidate in chain if key in candidate), None)
+        if pattern is None:
+            raise ValueError(f"No '{key}' list pattern for style '{style}' in locale '{locale_code}'.")
+        patterns[key] = pattern
+
+    return CompiledListFormat(patterns)
+
+
+class ListFormatter(BaseFormatter):
+    """
+    Formatter for list messages.
+
+    Joins a sequence of items according to the locale rules.
+    Example: {items, list}, {items, list, disjunction} or {items, list, unit-narrow}.
+
+    If style is not provided, it falls back to `conjunction`.
+    """
+
+    name = "list"
+    is_subnumeric = False
+    is_submessage = False
+    is_pure = True
+    cache_policy = CachePolicy(maxsize=256)
+
+    def __init__(self, strict: bool):
+        """Initialize the list formatter."""
+        self._strict = strict
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
+        """Format a list message."""
+        if not isinstance(node, FormatNode):
+            raise TypeError(f"{self.__class__.__name__} can only process FormatNode instances.")
+
+        value = kwargs.get(node.name)
+        if value is None:
+            return self._throw(
+                f"No list value provided for '{node.name}'.",
+                ValueError,
+            )
+
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            return self._throw(f"Cannot format '{node.name}' as list: expected an iterable of items.", TypeError)
+
+        try:
+            list_format = compile_list_format(t.locale_code, node.style or None)
+        except (ValueError, UnknownLocaleError) as e:
+            return self._throw(f"Invalid list style '{node.style}' for '{node.name}': {e}", ValueError)
+
+        return [TextNode(list_format.format(self._to_strings(value)))]
+
+    @staticmethod
+    def _to_strings(value: Any) -> Sequence[str]:
+        items = value if isinstance(value, (list, tuple)) else list(value)
+        if all(type(item) is str for item in items):
+            return items
+
+        return [str(item) for item in items]
+
+    def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
+        if self._strict:
+            raise exc_type(msg)
+        else:
+            self._logger.log(lvl, msg)
+            return []
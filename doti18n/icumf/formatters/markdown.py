@@ -1,15 +1,7 @@
-import logging
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from .tags import TagFormatter
 
-from ..nodes import Node, TagNode, TextNode
-from . import BaseFormatter
 
-if TYPE_CHECKING:
-    from doti18n import LocaleTranslator
-
-
-class MarkdownFormatter(BaseFormatter):
+class MarkdownFormatter(TagFormatter):
     """
     Formatter for Markdown tags inside messages.
 
@@ -20,41 +12,13 @@ class MarkdownFormatter(BaseFormatter):
     """
 
     name = "markdown"
-
-    def __init__(self, strict: bool):
-        """Initialize the MarkdownFormatter."""
-        self._strict = strict
-        self._logger = logging.getLogger(self.__class__.__name__)
-
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
-        """Format tags inside messages."""
-        if not isinstance(node, TagNode):
-            raise TypeError("MarkdownFormatter can only process TagNode instances.")
-
-        if node.name == "link":
-            if not (link := kwargs.get("link")):
-                return self._throw(
-                    "No 'link' value provided for 'link' tag.",
-                    ValueError,
-                )
-
-            return [TextNode("["), *node.children, TextNode("]"), TextNode(f"({link})")]
-
-        elif node.name in ["bold", "b", "strong"]:
-            return [TextNode("**"), *node.children, TextNode("**")]
-
-        elif node.name in ["italic", "i", "em"]:
-            return [TextNode("__"), *node.children, TextNode("__")]
-
-        elif node.name == "code":
-            return [TextNode("`"), *node.children, TextNode("`")]
-
-        else:
-            return self._throw(f"Unsupported tag '{node.name}'.", ValueError)
-
-    def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
-        if self._strict:
-            raise exc_type(msg)
-        else:
-            self._logger.log(lvl, msg)
-            return []
+    tags = {
+        "link": ("[", "]({link})"),
+        "bold": ("**", "**"),
+        "b": ("**", "**"),
+        "strong": ("**", "**"),
+        "italic": ("__", "__"),
+        "i": ("__", "__"),
+        "em": ("__", "__"),
+        "code": ("`", "`"),
+    }
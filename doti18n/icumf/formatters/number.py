@@ -0,0 +1,180 @@
+import copy
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from babel import Locale
+from babel.core import UnknownLocaleError, get_global
+from babel.numbers import NumberPattern, get_territory_currencies, parse_pattern
+
+from ..nodes import FormatNode, Node, TextNode
+from . import BaseFormatter, CachePolicy
+
+if TYPE_CHECKING:
+    from doti18n import LocaleTranslator
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledNumberFormat:
+    """A number pattern resolved for one locale and style, ready to be applied to values."""
+
+    pattern: NumberPattern
+    locale: Locale
+    currency: str | None = None
+    currency_digits: bool = True
+    group_separator: bool = True
+    scale: Decimal | None = None
+
+    def format(self, value: int | float | Decimal | str) -> str:
+        """Format the value using the compiled pattern."""
+        if self.scale is not None:
+            value = Decimal(str(value)) * self.scale
+
+        result: str = self.pattern.apply(
+            value,
+            self.locale,
+            currency=self.currency,
+            currency_digits=self.currency_digits,
+            group_separator=self.group_separator,
+        )
+        return result
+
+
+def _parse_locale(locale_code: str) -> Locale:
+    return Locale.parse(locale_code.replace("-", "_"))
+
+
+def _default_currency(locale: Locale) -> str:
+    territory = locale.territory
+    if not territory:
+        likely = get_global("likely_subtags").get(locale.language)
+        territory = Locale.parse(likely).territory if likely else None
+
+    currencies = get_territory_currencies(territory) if territory else []
+    if not currencies:
+        raise ValueError(f"No default currency for locale '{locale}'. Use '::currency/XXX' style instead.")
+
+    return currencies[0]
+
+
+def _with_fraction(pattern: NumberPattern, min_digits: int, max_digits: int) -> NumberPattern:
+    pattern = copy.copy(pattern)
+    pattern.frac_prec = (min_digits, max_digits)
+    return pattern
+
+
+def _compile_skeleton(locale: Locale, skeleton: str) -> CompiledNumberFormat:
+    """Compile a subset of ICU number skeletons (e.g., `::percent .00`, `::currency/EUR group-off`)."""
+    pattern = locale.decimal_formats[None]
+    currency = None
+    currency_digits = True
+    group_separator = True
+    scale = None
+    fraction = None
+
+    for token in skeleton.split():
+        if token in ("percent", "%"):
+            pattern = locale.percent_formats[None]
+        elif token.startswith("currency/"):
+            pattern = locale.currency_formats["standard"]
+            currency = token.split("/", 1)[1].upper()
+        elif token.startswith("scale/"):
+            scale = Decimal(token.split("/", 1)[1])
+        elif token == "precision-integer":
+            fraction = (0, 0)
+        elif token.startswith(".") and set(token[1:]) <= {"0", "#"} and "#0" not in token:
+            fraction = (token.count("0"), len(token) - 1)
+        elif token in ("group-off", ",_"):
+            group_separator = False
+        else:
+            raise ValueError(f"Unsupported number skeleton token '{token}'.")
+
+    if fraction is not None:
+        pattern = _with_fraction(pattern, *fraction)
+        currency_digits = False
+
+    return CompiledNumberFormat(pattern, locale, currency, currency_digits, group_separator, scale)
+
+
+@lru_cache(maxsize=1024)
+def compile_number_format(locale_code: str, style: str | None = None) -> CompiledNumberFormat:
+    """
+    Resolve the number pattern for a locale and style.
+
+    Results are cached and shared between all formatters, so each (locale, style)
+    pair is parsed only once.
+
+    :param locale_code: The locale code (e.g., 'en', 'pt-BR').
+    :param style: `integer`, `percent`, `currency`, an ICU skeleton starting with `::`,
+                  a CLDR number pattern (e.g., `#,##0.00`) or None for the default decimal format.
+    :return: The compiled number format.
+    :raises ValueError: If the locale or the style is invalid.
+    """
+    locale = _parse_locale(locale_code)
+    if not style:
+        return CompiledNumberFormat(locale.decimal_formats[None], locale)
+
+    if style == "integer":
+        return CompiledNumberFormat(_with_fraction(locale.decimal_formats[None], 0, 0), locale)
+
+    if style == "percent":
+        return CompiledNumberFormat(locale.percent_formats[None], locale)
+
+    if style == "currency":
+        return CompiledNumberFormat(locale.currency_formats["standard"], locale, _default_currency(locale))
+
+    if style.startswith("::"):
+        return _compile_skeleton(locale, style[2:])
+
+    return CompiledNumberFormat(parse_pattern(style), locale)
+
+
+class NumberFormatter(BaseFormatter):
+    """
+    Formatter for number messages.
+
+    Formats numbers according to the locale rules (grouping, decimal separator, etc.).
+    Example: {price, number}, {share, number, percent}, {price, number, currency} or {n, number, ::.00}.
+
+    If style is not provided, it falls back to the locale's decimal format.
+    """
+
+    name = "number"
+    is_subnumeric = False
+    is_submessage = False
+    is_pure = True
+    cache_policy = CachePolicy(maxsize=2048)
+
+    def __init__(self, strict: bool):
+        """Initialize the number formatter."""
+        self._strict = strict
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
+        """Format a number message."""
+        if not isinstance(node, FormatNode):
+            raise TypeError("NumberFormatter can only process FormatNode instances.")
+
+        value = kwargs.get(node.name)
+        if value is None:
+            return self._throw(
+                f"No number value provided for '{node.name}'.",
+                ValueError,
+            )
+
+        try:
+            number_format = compile_number_format(t.locale_code, node.style or None)
+        except (ValueError, UnknownLocaleError) as e:
+            return self._throw(f"Invalid number style '{node.style}' for '{node.name}': {e}", ValueError)
+
+        return [TextNode(number_format.format(value))]
+
+    def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
+        if self._strict:
+            raise exc_type(msg)
+        else:
+            self._logger.log(lvl, msg)
+            return []
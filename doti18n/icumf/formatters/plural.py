@@ -1,7 +1,9 @@
 import logging
 from collections.abc import Sequence
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from ...utils import _plural_operand
 from ..nodes import MessageNode, Node
 from . import BaseFormatter
 
@@ -16,6 +18,9 @@ class PluralFormatter(BaseFormatter):
     This formatter selects the appropriate plural form based on a count value.
     Example: {count, plural, one {1 item} other {# items}}.
 
+    Counts can be integers, floats, Decimals or numeric strings. Visible fraction digits
+    are taken into account, so "1.0" and 1.5 select the CLDR form for fractions.
+
     If no count value is provided, it raises an error or logs a warning based on the strict mode.
     """
 
@@ -28,11 +33,10 @@ class PluralFormatter(BaseFormatter):
         self._strict = strict
         self._logger = logging.getLogger(self.__class__.__name__)
 
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
         """Format a plural message."""
         if not isinstance(node, MessageNode):
             raise TypeError("PluralFormatter can only process MessageNode instances.")
-        options = node.options
         count = kwargs.get(node.name)
         if count is None:
             return self._throw(
@@ -40,24 +44,38 @@ class PluralFormatter(BaseFormatter):
                 ValueError,
             )
 
-        guess_option = f"={count}"
-        if guess_option in options:
-            return options[guess_option]
+        if not node.compiled:
+            node.compile()
 
-        count = abs(int(count))
-        try:
-            option = t._main_plural_func(count)
-        except Exception as e:
-            self._logger.warning(f"Error determining plural form for count '{count}': {e}. Falling back to 'other'.")
-            option = "other"
+        if type(count) is not int:
+            try:
+                count = _plural_operand(count)
+            except (TypeError, ValueError) as e:
+                return self._throw(f"Invalid count value for '{node.name}': {e}", type(e))
+
+        # Decimal('1.0') hashes and compares equal to 1, so it matches '=1' too
+        if (branch := node.exact.get(count)) is not None:
+            return branch
 
-        if not (result := options.get(option, None)):
+        # `=N` selectors match the count itself, categories are selected for the count minus the offset
+        option = self._plural_form(t, count - node.offset if node.offset else count)
+        if (branch := node.categories.get(option, node.fallback)) is None:
             return self._throw(
                 f"No message found for option '{option}' in '{node.name}'.",
                 ValueError,
             )
 
-        return result
+        return branch
+
+    def _plural_form(self, t: "LocaleTranslator", count: int | Decimal) -> str:
+        if count < 0:
+            count = -count
+
+        try:
+            return t._main_plural_func(count)
+        except Exception as e:
+            self._logger.warning("Error determining plural form for count '%s': %s. Falling back to 'other'.", count, e)
+            return "other"
 
     def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
         if self._strict:
@@ -0,0 +1,222 @@
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from babel import Locale
+from babel.core import UnknownLocaleError
+from babel.dates import TIMEDELTA_UNITS
+
+from ..nodes import FormatNode, Node, TextNode
+from . import BaseFormatter
+from .number import compile_number_format
+
+if TYPE_CHECKING:
+    from doti18n import LocaleTranslator
+
+STYLES = ("long", "short", "narrow")
+PLURAL_CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+
+def _resolve_categories(*candidates: dict[str, str] | None) -> dict[str, str]:
+    """Merge plural patterns, so every category maps to the first pattern found for it (or for 'other')."""
+    resolved = {}
+    for category in PLURAL_CATEGORIES:
+        for patterns in candidates:
+            if patterns and (pattern := patterns.get(category) or patterns.get("other")):
+                resolved[category] = pattern
+                break
+
+    return resolved
+
+
+class CompiledUnitPatterns:
+    """
+    Relative time and duration patterns of one locale and style, resolved once.
+
+    Every (unit, plural category) pair maps directly to its pattern,
+    so formatting a value is a couple of dict lookups.
+    """
+
+    __slots__ = ("plural_form", "format_number", "future", "past", "duration")
+
+    def __init__(self, locale: Locale, style: str, format_number: Callable[[Any], str]):
+        """Resolve the patterns of all units for the locale and style."""
+        date_fields = locale._data["date_fields"]
+        unit_patterns = locale._data["unit_patterns"]
+
+        self.plural_form = locale.plural_form
+        self.format_number = format_number
+        self.future: dict[str, dict[str, str]] = {}
+        self.past: dict[str, dict[str, str]] = {}
+        self.duration: dict[str, dict[str, str]] = {}
+        for unit, _ in TIMEDELTA_UNITS:
+            durations = unit_patterns.get(f"duration-{unit}", {})
+            # CLDR aliases long and narrow unit lengths to short
+            fallback = durations.get("short") if style in ("long", "narrow") else None
+            relative = date_fields.get(f"{unit}-{style}") or date_fields.get(unit) or {}
+
+            self.duration[unit] = _resolve_categories(durations.get(style), fallback)
+            self.future[unit] = _resolve_categories(relative.get("future"), durations.get(style), fallback)
+            self.past[unit] = _resolve_categories(relative.get("past"), durations.get(style), fallback)
+
+    def format(
+        self, seconds: float, add_direction: bool = False, granularity: str = "second", threshold: float = 0.85
+    ) -> str:
+        """
+        Format a time delta given in seconds, like `babel.dates.format_timedelta`.
+
+        :param seconds: The delta. Positive values are in the future, negative ones in the past.
+        :param add_direction: Render "in 5 minutes"/"5 minutes ago" instead of "5 minutes".
+        :param granularity: The smallest unit to display.
+        :param threshold: Factor that determines at which point the presentation switches to the next higher unit.
+        :return: The formatted delta.
+        """
+        if add_direction:
+            table = self.future if seconds >= 0 else self.past
+        else:
+            table = self.duration
+
+        for unit, seconds_per_unit in TIMEDELTA_UNITS:
+            value = abs(seconds) / seconds_per_unit
+            if value >= threshold or unit == granularity:
+                if unit == granularity and value > 0:
+                    value = max(1, value)
+                value = int(round(value))
+                pattern = table[unit].get(self.plural_form(value))
+                return pattern.replace("{0}", self.format_number(value)) if pattern else ""
+
+        return ""
+
+
+@lru_cache(maxsize=256)
+def compile_unit_patterns(locale_code: str, style: str = "long") -> CompiledUnitPatterns:
+    """
+    Resolve relative time and duration patterns for a locale and style.
+
+    Results are cached and shared between all formatters.
+
+    :param locale_code: The locale code (e.g., 'en', 'pt-BR').
+    :param style: `long`, `short` or `narrow`.
+    :return: The compiled patterns.
+    :raises ValueError: If the locale or the style is invalid.
+    """
+    if style not in STYLES:
+        raise ValueError(f"Unsupported style '{style}'. Use one of: {', '.join(STYLES)}.")
+
+    locale = Locale.parse(locale_code.replace("-", "_"))
+    return CompiledUnitPatterns(locale, style, compile_number_format(locale_code).format)
+
+
+def _to_seconds(value: Any, now: datetime | None = None) -> float:
+    """Convert a timedelta, a datetime (relative to `now`) or a number of seconds to seconds."""
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, datetime):
+        if now is None:
+            now = datetime.now(UTC) if value.tzinfo else datetime.now()
+        return (value - now).total_seconds()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+
+    raise TypeError(f"Unsupported time delta value type: {type(value).__name__}")
+
+
+def format_relative_times(
+    locale_code: str,
+    values: Iterable[datetime | timedelta | float],
+    now: datetime | None = None,
+    style: str = "long",
+    add_direction: bool = True,
+) -> list[str]:
+    """
+    Format many deltas at once, e.g., the timestamps of a feed.
+
+    The patterns are resolved once and all datetimes are compared to the same reference time.
+
+    :param locale_code: The locale code (e.g., 'en').
+    :param values: Datetimes, timedeltas or deltas in seconds.
+    :param now: Reference time for datetimes. Defaults to the current time.
+    :param style: `long`, `short` or `narrow`.
+    :param add_direction: Render "5 minutes ago" instead of "5 minutes".
+    :return: Formatted values, in the same order.
+    """
+    patterns = compile_unit_patterns(locale_code, style)
+    if now is None:
+        now = datetime.now(UTC)
+    naive_now = now.replace(tzinfo=None) if now.tzinfo else now
+    aware_now = now if now.tzinfo else now.replace(tzinfo=UTC)
+
+    result = []
+    for value in values:
+        if isinstance(value, datetime):
+            seconds = (value - (aware_now if value.tzinfo else naive_now)).total_seconds()
+        else:
+            seconds = _to_seconds(value)
+        result.append(patterns.format(seconds, add_direction))
+
+    return result
+
+
+class RelativeTimeFormatter(BaseFormatter):
+    """
+    Formatter for relative time messages.
+
+    Renders the distance to a point in time using CLDR patterns, e.g., "5 minutes ago" or "in 3 days".
+    Example: {posted, relativetime} or {posted, relativetime, short}.
+
+    Values can be datetimes (compared to the current time), timedeltas or deltas in seconds.
+    Styles are `long` (default), `short` and `narrow`.
+    """
+
+    name = "relativetime"
+    is_subnumeric = False
+    is_submessage = False
+    # datetimes are compared to the current time
+    is_volatile = True
+    add_direction = True
+
+    def __init__(self, strict: bool):
+        """Initialize the formatter."""
+        self._strict = strict
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
+        """Format a relative time message."""
+        if not isinstance(node, FormatNode):
+            raise TypeError(f"{self.__class__.__name__} can only process FormatNode instances.")
+
+        value = kwargs.get(node.name)
+        if value is None:
+            return self._throw(
+                f"No value provided for '{node.name}'.",
+                ValueError,
+            )
+
+        try:
+            patterns = compile_unit_patterns(t.locale_code, node.style or "long")
+            seconds = _to_seconds(value)
+        except (ValueError, TypeError, UnknownLocaleError) as e:
+            return self._throw(f"Cannot format '{node.name}' as {self.name}: {e}", type(e))
+
+        return [TextNode(patterns.format(seconds, self.add_direction))]
+
+    def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
+        if self._strict:
+            raise exc_type(msg)
+        else:
+            self._logger.log(lvl, msg)
+            return []
+
+
+class DurationFormatter(RelativeTimeFormatter):
+    """
+    Formatter for duration messages.
+
+    Renders a duration without direction, e.g., "5 minutes".
+    Example: {elapsed, duration} or {elapsed, duration, narrow}.
+    """
+
+    name = "duration"
+    add_direction = False
@@ -2,6 +2,7 @@ import logging
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
+from ...diagnostics import diagnostics
 from ...utils import _NOT_FOUND
 from ..nodes import MessageNode, Node
 from . import BaseFormatter
@@ -29,35 +30,45 @@ class SelectFormatter(BaseFormatter):
         self._strict = strict
         self._logger = logging.getLogger(self.__class__.__name__)
 
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
         """Format a select message."""
         if not isinstance(node, MessageNode):
             raise TypeError("SelectFormatter can only process MessageNode instances.")
 
-        options = node.options
+        if not node.compiled:
+            node.compile()
+
         option = kwargs.get(node.name, _NOT_FOUND)
-        if option not in options:
-            if "other" in options:
-                if option is _NOT_FOUND:
-                    self._logger.warning(f"No option provided for '{node.name}'. " f"Fallback to 'other'.")
-                else:
-                    self._logger.warning(
-                        f"Option '{option}' is not valid option for '{node.name}'. " f"Fallback to 'other'."
-                    )
-                option = "other"
-            else:
-                return self._throw(
-                    f"No option provided for '{node.name}' " f"and 'other' option is missing.",
-                    ValueError,
-                )
+        if (branch := node.categories.get(option)) is not None:
+            return branch
 
-        if not (result := options.get(option, None)):
+        if (branch := node.fallback) is None:
             return self._throw(
-                f"No message found for option '{option}' in '{node.name}'.",
+                f"No option provided for '{node.name}' " f"and 'other' option is missing.",
                 ValueError,
             )
 
-        return result
+        if option is _NOT_FOUND:
+            diagnostics.record(
+                "select_fallback",
+                t.locale_code,
+                node.name,
+                "No option provided for '%s'. Fallback to 'other'.",
+                node.name,
+                source=self._logger,
+            )
+        else:
+            diagnostics.record(
+                "select_fallback",
+                t.locale_code,
+                node.name,
+                "Option '%s' is not valid option for '%s'. Fallback to 'other'.",
+                option,
+                node.name,
+                source=self._logger,
+            )
+
+        return branch
 
     def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
         if self._strict:
@@ -2,6 +2,7 @@ import logging
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
+from ...utils import _plural_operand
 from ..nodes import MessageNode, Node
 from . import BaseFormatter
 
@@ -28,12 +29,11 @@ class SelectordinalFormatter(BaseFormatter):
         self._strict = strict
         self._logger = logging.getLogger(self.__class__.__name__)
 
-    def __call__(self, t: "LocaleTranslator", node: Node, **kwargs) -> Sequence[Node | None]:
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
         """Format a selectordinal message."""
         if not isinstance(node, MessageNode):
             raise TypeError("SelectordinalFormatter can only process MessageNode instances.")
 
-        options = node.options
         count = kwargs.get(node.name)
         if count is None:
             return self._throw(
@@ -41,26 +41,35 @@ class SelectordinalFormatter(BaseFormatter):
                 ValueError,
             )
 
-        count = abs(int(count))
-        guess_option = f"={count}"
-        if guess_option in options:
-            return options[guess_option]
+        if not node.compiled:
+            node.compile()
+
+        if type(count) is not int:
+            try:
+                count = _plural_operand(count)
+            except (TypeError, ValueError) as e:
+                return self._throw(f"Invalid count value for '{node.name}': {e}", type(e))
+        if count < 0:
+            count = -count
+
+        if (branch := node.exact.get(count)) is not None:
+            return branch
 
         try:
             option = t._ordinal_func(count)
         except Exception as e:
             self._logger.warning(
-                f"Error determining selectordinal form for count '{count}': {e}. Falling back to 'other'."
+                "Error determining selectordinal form for count '%s': %s. Falling back to 'other'.", count, e
             )
             option = "other"
 
-        if not (result := options.get(option, None)):
+        if (branch := node.categories.get(option, node.fallback)) is None:
             return self._throw(
                 f"No message found for option '{option}' in '{node.name}'.",
                 ValueError,
             )
 
-        return result
+        return branch
 
     def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
         if self._strict:
@@ -0,0 +1,176 @@
+import logging
+from collections.abc import Mapping, Sequence
+from string import Formatter
+from typing import TYPE_CHECKING
+
+from ..nodes import Node, TagNode, TextNode
+from . import BaseFormatter
+
+if TYPE_CHECKING:
+    from doti18n import LocaleTranslator
+
+_FIELDS = Formatter()
+
+
+class TagTemplate:
+    """
+    Opening and closing text of a tag, compiled once.
+
+    Both parts may reference message arguments with `str.format` placeholders
+    (e.g., `<a href="{link}">`). Templates without placeholders are static:
+    their text, nodes and encoded bytes are built here and shared by every render.
+    """
+
+    __slots__ = ("prefix", "suffix", "required", "prefix_node", "suffix_node", "prefix_bytes", "suffix_bytes")
+
+    def __init__(self, prefix: str, suffix: str):
+        """
+        Compile the template.
+
+        :param prefix: Text rendered before the tag content.
+        :param suffix: Text rendered after the tag content.
+        :raises ValueError: If a placeholder is malformed.
+        """
+        required = []
+        for part in (prefix, suffix):
+            for _, field, _, _ in _FIELDS.parse(part):
+                if field is None:
+                    continue
+                if not (name := field.split(".", 1)[0].split("[", 1)[0]):
+                    raise ValueError(f"Tag templates only support named placeholders, got '{part}'.")
+                if name not in required:
+                    required.append(name)
+
+        # arguments the tag needs to be rendered
+        self.required: tuple[str, ...] = tuple(required)
+        if self.required:
+            self.prefix, self.suffix = prefix, suffix
+        else:
+            # unescape `{{` and `}}`
+            self.prefix, self.suffix = prefix.format(), suffix.format()
+
+        self.prefix_node = TextNode(self.prefix)
+        self.suffix_node = TextNode(self.suffix)
+        self.prefix_bytes = self.prefix.encode("utf-8")
+        self.suffix_bytes = self.suffix.encode("utf-8")
+
+    @property
+    def is_static(self) -> bool:
+        """Return True, if the template doesn't reference any argument."""
+        return not self.required
+
+    def render(self, node: TagNode, kwargs: Mapping) -> list[Node]:
+        """Wrap the children of `node` into the prefix and the suffix."""
+        if not self.required:
+            return [self.prefix_node, *node.children, self.suffix_node]
+
+        return [TextNode(self.prefix.format_map(kwargs)), *node.children, TextNode(self.suffix.format_map(kwargs))]
+
+    def __repr__(self):
+        """Return a string representation of the TagTemplate."""
+        return f"TagTemplate({self.prefix!r}, {self.suffix!r})"
+
+
+class TagFormatter(BaseFormatter):
+    """
+    Base class for tag formatters driven by a tag -> (prefix, suffix) mapping.
+
+    Subclasses declare `tags`. Templates are compiled once per tag name,
+    and tags without placeholders are rendered by the engine as two constant
+    strings around the children. Custom tags can be added per instance with
+    the `tags` argument or with `register_tag`.
+    """
+
+    tags: Mapping[str, tuple[str, str]] = {}
+
+    def __init__(self, strict: bool, tags: Mapping[str, tuple[str, str] | TagTemplate] | None = None):
+        """
+        Initialize the tag formatter.
+
+        :param strict: Whether to raise on errors instead of logging them.
+        :param tags: Extra tag -> (prefix, suffix) mappings. They override the declared ones.
+        """
+        self._strict = strict
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._templates: dict[str, TagTemplate | None] = {}
+        for name, template in {**self.tags, **(tags or {})}.items():
+            self.register_tag(name, template)
+
+    def register_tag(self, name: str, prefix: str | tuple[str, str] | TagTemplate, suffix: str | None = None):
+        """
+        Add or replace a tag mapping.
+
+        Tags already rendered with this formatter keep their cached output,
+        so register tags before rendering messages.
+
+        :param name: The tag name.
+        :param prefix: Text before the tag content, a (prefix, suffix) pair or a compiled template.
+        :param suffix: Text after the tag content.
+        :raises TypeError: If the mapping is invalid.
+        """
+        if isinstance(prefix, TagTemplate):
+            template = prefix
+        elif isinstance(prefix, str) and isinstance(suffix, str):
+            template = TagTemplate(prefix, suffix)
+        elif isinstance(prefix, tuple) and len(prefix) == 2 and suffix is None:
+            template = TagTemplate(*prefix)
+        else:
+            raise TypeError(f"Invalid mapping for tag '{name}': expected a prefix and a suffix.")
+
+        self._templates[name] = template
+
+    def get_template(self, name: str) -> TagTemplate | None:
+        """
+        Return the compiled template of a tag.
+
+        :param name: The tag name.
+        :return: The template, or None if the tag is not supported.
+        """
+        try:
+            return self._templates[name]
+        except KeyError:
+            template = self._templates[name] = self.default_template(name)
+            return template
+
+    def static_template(self, node: TagNode) -> TagTemplate | None:
+        """
+        Return the template of a tag, if it doesn't reference any argument.
+
+        The engine renders such tags as the prefix, the children and the suffix, without calling the formatter.
+        """
+        template = self.get_template(node.name)
+        return template if template is not None and not template.required else None
+
+    def default_template(self, name: str) -> TagTemplate | None:
+        """
+        Build the template of a tag that has no mapping. It's called once per tag name.
+
+        :param name: The tag name.
+        :return: The template, or None to reject the tag.
+        """
+        return None
+
+    def __call__(self, t: "LocaleTranslator", node: Node, /, **kwargs) -> Sequence[Node | None]:
+        """Format tags inside messages."""
+        if not isinstance(node, TagNode):
+            raise TypeError(f"{self.__class__.__name__} can only process TagNode instances.")
+
+        if (template := self.get_template(node.name)) is None:
+            return self._throw(f"Unsupported tag '{node.name}'.", ValueError)
+
+        for arg in template.required:
+            if not kwargs.get(arg):
+                return self._throw(f"No '{arg}' value provided for '{node.name}' tag.", ValueError)
+
+        return template.render(node, kwargs)
+
+    def is_static(self, node: Node) -> bool:
+        """Return True for supported tags whose template doesn't reference any argument."""
+        return isinstance(node, TagNode) and self.static_template(node) is not None
+
+    def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> list:
+        if self._strict:
+            raise exc_type(msg)
+        else:
+            self._logger.log(lvl, msg)
+            return []
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from decimal import Decimal
 
 
 @dataclass(slots=True, eq=False)
@@ -13,6 +14,7 @@ class TextNode(Node):
     """Node for plain text segments in the message."""
 
     value: str
+    encoded: bytes | None = None  # UTF-8 encoded `value`, filled on first bytes render.
 
     def __repr__(self):
         """Return a string representation of the TextNode."""
@@ -27,6 +29,7 @@ class FormatNode(Node):
     type: str | None = None  # 'date', 'number', 'time', etc.
     style: str | None = None  # 'short', '::.00', 'percent', etc.
     is_hash: bool = False  # True, if this node represents a hash (#) in plural messages.
+    offset: int = 0  # The offset of the enclosing plural, subtracted from the value a hash (#) displays.
 
     def __repr__(self):
         """Return a string representation of the FormatNode."""
@@ -46,6 +49,29 @@ class MessageNode(Node):
     type: str  # 'plural', 'selectordinal', 'select'
     options: dict[str, list[Node]] = field(default_factory=dict)
     offset: int = 0
+    # Dispatch tables, filled by `compile()`.
+    exact: dict[int | Decimal, list[Node]] = field(default_factory=dict)  # `=N` selectors, also matched by Decimal(N)
+    categories: dict[str, list[Node]] = field(default_factory=dict)  # every selector as written
+    fallback: list[Node] | None = None  # the `other` branch, if any
+    compiled: bool = False
+
+    def compile(self) -> "MessageNode":
+        """
+        Build the branch dispatch tables from `options`.
+
+        After compiling, formatters can select a branch with plain dict lookups
+        instead of building `=N` selector strings on every call.
+        """
+        exact: dict[int | Decimal, list[Node]] = {}
+        for selector, branch in self.options.items():
+            if selector.startswith("=") and selector[1:].isdecimal():
+                exact[int(selector[1:])] = branch
+
+        self.exact = exact
+        self.categories = dict(self.options)
+        self.fallback = self.options.get("other")
+        self.compiled = True
+        return self
 
     def __repr__(self):
         """Return a string representation of the MessageNode."""
@@ -58,6 +84,10 @@ class TagNode(Node):
 
     name: str
     children: list[Node] = field(default_factory=list)
+    arg_free: bool = False  # True, if no argument is referenced anywhere inside the tag.
+    # Tag formatter -> rendered subtree (or None if not static), for a few formatters at most.
+    rendered: dict = field(default_factory=dict)
+    encoded: dict = field(default_factory=dict)  # Tag formatter -> UTF-8 encoded `rendered` entry.
 
     def __repr__(self):
         """Return a string representation of the TagNode."""
@@ -141,7 +141,9 @@ class Parser:
 
             if char == CHAR_HASH:
                 if isinstance(parent_node, MessageNode) and parent_node.type in self.subnumeric_types:
-                    nodes.append(FormatNode(name=parent_node.name, type="count", is_hash=True))
+                    nodes.append(
+                        FormatNode(name=parent_node.name, type="count", is_hash=True, offset=parent_node.offset)
+                    )
                     context["i"] += 1
                     continue
 
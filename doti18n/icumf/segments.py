@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def utf16_len(text: str) -> int:
+    """Return the length of the string in UTF-16 code units."""
+    if text.isascii():
+        return len(text)
+
+    return len(text.encode("utf-16-le")) // 2
+
+
+@dataclass(slots=True, frozen=True)
+class Span:
+    """
+    A formatted range of a rendered message.
+
+    Offsets are given both in code points (for Python slicing) and in UTF-16
+    code units (for Telegram entities, JavaScript and most UI toolkits).
+    """
+
+    tag: str
+    offset: int
+    length: int
+    utf16_offset: int
+    utf16_length: int
+    attrs: dict[str, Any] = field(default_factory=dict)
+    depth: int = 0  # Number of enclosing tags.
+
+    def __repr__(self):
+        """Return a string representation of the Span."""
+        return f"Span({self.tag}, offset={self.offset}, length={self.length})"
+
+
+@dataclass(slots=True, frozen=True)
+class RichText:
+    """Plain text of a rendered message together with the spans of its tags, in opening order."""
+
+    text: str
+    spans: tuple[Span, ...] = ()
+
+    def __str__(self):
+        """Return the plain text."""
+        return self.text
+
+
+__all__ = [
+    "RichText",
+    "Span",
+    "utf16_len",
+]
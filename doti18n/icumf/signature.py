@@ -0,0 +1,183 @@
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from .formatters import TagFormatter
+from .nodes import FormatNode, MessageNode, Node, TagNode
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, Decimal, str)) and not isinstance(value, bool)
+
+
+def _is_items(value: Any) -> bool:
+    return not isinstance(value, (str, bytes)) and hasattr(value, "__iter__")
+
+
+# formatter type -> cheap check of the argument value
+EXPECTED_VALUES: dict[str, tuple[str, Callable[[Any], bool]]] = {
+    "plural": ("a number", _is_number),
+    "selectordinal": ("a number", _is_number),
+    "number": ("a number", _is_number),
+    "count": ("a number", _is_number),
+    "list": ("an iterable of items", _is_items),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ArgSpec:
+    """An argument referenced by a message."""
+
+    name: str
+    types: tuple[str | None, ...]  # formatter types the argument is used with, None for a plain `{name}`
+    required: bool  # True, if every render of the message reads the argument
+    branches: tuple[str, ...]  # selector paths it's used under, e.g., "g=male/count=one"
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MessageSignature:
+    """
+    The arguments and tags of a compiled message, extracted once.
+
+    It allows to validate the arguments of every message at startup,
+    or to check them cheaply before a render instead of handling a failed one.
+    """
+
+    args: dict[str, ArgSpec]  # sorted by name
+    tags: dict[str, bool]  # tag name -> True, if the tag is rendered on every call
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Return all argument names, sorted. It's also the order of positional arguments."""
+        return tuple(self.args)
+
+    @property
+    def required(self) -> tuple[str, ...]:
+        """Return the names of the arguments every render reads."""
+        return tuple(name for name, spec in self.args.items() if spec.required)
+
+    def check(self, kwargs: Mapping[str, Any], tag_formatter: Any = None) -> list[str]:
+        """
+        Check message arguments without rendering the message.
+
+        Only missing required arguments and values that obviously don't fit
+        their formatter are reported. If `tag_formatter` is a TagFormatter,
+        the arguments its templates need (e.g., `link`) are checked too.
+
+        :param kwargs: Message arguments.
+        :param tag_formatter: The tag formatter the message will be rendered with.
+        :return: List of problems, empty if none were found.
+        """
+        problems = []
+        for name, spec in self.args.items():
+            if name not in kwargs:
+                if spec.required:
+                    problems.append(f"Missing argument '{name}'.")
+                continue
+
+            value = kwargs[name]
+            for kind in spec.types:
+                if kind in EXPECTED_VALUES and not (expected := EXPECTED_VALUES[kind])[1](value):
+                    problems.append(
+                        f"Argument '{name}' of type '{kind}' must be {expected[0]}, got {type(value).__name__}."
+                    )
+                    break
+
+        if isinstance(tag_formatter, TagFormatter):
+            for tag, always in self.tags.items():
+                if (template := tag_formatter.get_template(tag)) is None:
+                    problems.append(f"Unsupported tag '{tag}'.")
+                elif always:
+                    problems.extend(
+                        f"Missing argument '{arg}' for '{tag}' tag." for arg in template.required if not kwargs.get(arg)
+                    )
+
+        return problems
+
+    def bind_args(self, args: Sequence[Any], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Map positional arguments onto `names` and merge them with keyword arguments.
+
+        :raises TypeError: If there are too many positional arguments or an argument is given twice.
+        """
+        names = self.names
+        if len(args) > len(names):
+            raise TypeError(f"Message takes {len(names)} positional arguments ({', '.join(names)}), got {len(args)}.")
+
+        for name, value in zip(names, args):
+            if name in kwargs:
+                raise TypeError(f"Got multiple values for argument '{name}'.")
+            kwargs[name] = value
+
+        return kwargs
+
+
+class _Extractor:
+    __slots__ = ("types", "branches", "tags")
+
+    def __init__(self):
+        self.types: dict[str, list[str | None]] = {}
+        self.branches: dict[str, list[str]] = {}
+        self.tags: dict[str, bool] = {}
+
+    def use(self, name: str, kind: str | None, path: tuple[str, ...]):
+        types = self.types.setdefault(name, [])
+        if kind not in types:
+            types.append(kind)
+        branches = self.branches.setdefault(name, [])
+        if path and (branch := "/".join(path)) not in branches:
+            branches.append(branch)
+
+    def walk(self, nodes: Sequence[Node], path: tuple[str, ...]) -> set[str]:
+        """Collect the arguments of `nodes` and return the ones read on every render of them."""
+        required = set()
+        for node in nodes:
+            if isinstance(node, FormatNode):
+                # `#` is the value of the enclosing plural, which is already recorded
+                if not node.is_hash:
+                    self.use(node.name, node.type, path)
+                    required.add(node.name)
+
+            elif isinstance(node, MessageNode):
+                self.use(node.name, node.type, path)
+                # a missing `select` value falls back to `other`, so it's only needed without one
+                if node.type != "select" or "other" not in node.options:
+                    required.add(node.name)
+                options = [self.walk(branch, (*path, f"{node.name}={key}")) for key, branch in node.options.items()]
+                if options:
+                    required |= set.intersection(*options)
+
+            elif isinstance(node, TagNode):
+                self.tags[node.name] = self.tags.get(node.name, False) or not path
+                required |= self.walk(node.children, path)
+
+        return required
+
+
+def extract_signature(nodes: Sequence[Node]) -> MessageSignature:
+    """
+    Extract the signature of a message from its nodes.
+
+    :param nodes: Parsed message nodes.
+    :return: The message signature.
+    """
+    extractor = _Extractor()
+    required = extractor.walk(nodes, ())
+    args = {
+        name: ArgSpec(
+            name,
+            tuple(extractor.types[name]),
+            name in required,
+            tuple(extractor.branches[name]),
+        )
+        for name in sorted(extractor.types)
+    }
+    return MessageSignature(args, extractor.tags)
+
+
+__all__ = [
+    "ArgSpec",
+    "MessageSignature",
+    "extract_signature",
+]
@@ -1,17 +1,23 @@
 import logging
 import os
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+from ..diagnostics import DottedPath
 from ..errors import (
     InvalidLocaleDocumentError,
+    MacroError,
     MissingFileExtensionError,
     UnsupportedFileExtensionError,
 )
-from ..icumf import ICUMF
+from ..icumf import ICUMF, CompiledMessage, CompiledPlural
+from ..macros import MACRO_KEYS, Macros
+from ..utils import _is_plural_dict
 from .base_loader import BaseLoader
 
 # ruff: noqa F401
+from .d18n_loader import CatalogDict, D18nLoader
 from .json_loader import JsonLoader
 from .xml_loader import XmlLoader
 from .yaml_loader import YamlLoader
@@ -19,12 +25,39 @@ from .toml_loader import TomlLoader
 
 logger = logging.getLogger(__name__)
 
+# post-processing stages of loaded data, in the order they are applied
+STAGES = ("validate", "macros", "icumf")
+# a user hook: (string, path of the string in its locale) -> new value
+Hook = Callable[[str, DottedPath], Any]
+
 
 class Loader:
     """Loader class for loading locale files."""
 
-    def __init__(self, strict: bool = False, icumf: ICUMF | bool | None = None):
-        """Initialize the Loader class."""
+    def __init__(
+        self,
+        strict: bool = False,
+        icumf: ICUMF | bool | None = None,
+        compile_plurals: bool = False,
+        stages: Iterable[str] | None = None,
+        hooks: Iterable[Hook] = (),
+    ):
+        """
+        Initialize the Loader class.
+
+        :param strict: Whether to raise errors instead of logging them.
+        :param icumf: The ICUMF engine to parse messages with. None creates one, False disables ICUMF.
+        :param compile_plurals: Compile plural dicts (`{one: ..., other: ...}`) into ICU plural messages,
+                                so they are rendered and cached by the ICUMF engine.
+        :param stages: Post-processing stages to run, out of `STAGES`. None runs all of them.
+        :param hooks: Callables applied to every string after macro expansion and before ICU compilation.
+                      They get the string and its `DottedPath`, and return the value to store.
+        :raises ValueError: If a stage is unknown.
+        """
+        stages = STAGES if stages is None else tuple(stages)
+        if unknown := set(stages) - set(STAGES):
+            raise ValueError(f"Unknown loader stages: {sorted(unknown)}. Available stages: {STAGES}")
+
         if icumf is None:
             icumf = ICUMF(strict)
         self.loaders = {}
@@ -38,22 +71,50 @@ class Loader:
             else:
                 raise ValueError(f"Invalid file extension type: {type(extension)} for loader {loader_cls.__name__}")
 
+        for loader in set(self.loaders.values()):
+            if loader.precompiled:
+                # compiled catalogs hold parsed messages, they only need an engine to run them
+                loader.engine = icumf if isinstance(icumf, ICUMF) else None
+
         self._logger = logger
         self._strict = strict
         self._icumf = icumf
+        self._compile_plurals = compile_plurals
+        self.stages: tuple[str, ...] = tuple(stage for stage in STAGES if stage in stages)
+        self.hooks: tuple[Hook, ...] = tuple(hooks)
 
     def get_supported_extensions(self) -> tuple[str]:
         """Return a list of supported file extensions."""
         return tuple(self.loaders.keys())
 
-    def load(self, filepath: str | Path) -> dict[str, dict[str, Any]]:
+    def is_precompiled(self, filepath: str | Path) -> bool:
+        """Return True, if the file is a compiled catalog, which is mapped into memory instead of being parsed."""
+        loader = self.loaders.get(os.path.splitext(filepath)[1].lower())
+        return loader is not None and loader.precompiled
+
+    def load(self, filepath: str | Path, previous: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Load the content of a file and process it based on its extension.
+
+        All enabled stages are applied in a single traversal of the data.
+        The result is the same as `read` followed by `compile_messages`.
+
+        :param filepath: The path to the file to be loaded.
+        :param previous: Data of a previous load of the same file. See `compile_messages`.
+        :return: The data loaded from the file, keyed by locale code.
+        :raises MissingFileExtensionError: If the file does not have an extension.
+        :raises UnsupportedFileExtensionError: If the file extension is not supported.
+        """
+        return self._process(self._read(filepath), filepath, previous, read=True, compile=True)
+
+    def read(self, filepath: str | Path) -> dict[str, dict[str, Any]]:
         """
-        Load the content of a file and processes it based on its extension.
+        Read a file, validate it and apply macros, without running hooks or compiling ICU messages.
 
         This method takes a file path as input, determines the file extension, and
         uses the associated loader to process the file content. If the file has no
-        extension or the extension is unsupported, an exception is raised. If the file
-        contains multiple locales, additional processing is performed.
+        extension or the extension is unsupported, an exception is raised.
+        The result holds only plain data, so it can be sent between processes.
 
         :param filepath: The path to the file to be loaded.
         :type filepath: str
@@ -63,6 +124,24 @@ class Loader:
         :raises MissingFileExtensionError: If the file does not have an extension.
         :raises UnsupportedFileExtensionError: If the file extension is not supported.
         """
+        return self._process(self._read(filepath), filepath, read=True)
+
+    def compile_messages(self, data: dict[str, Any], previous: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Run hooks and compile the ICU messages of data returned by `read`. The data is modified in place.
+
+        If the data of a previous load of the same file is given, messages whose source string
+        (or plural dict) didn't change are taken from it instead of being parsed again.
+        The reused messages keep their caches, so only new and changed messages start cold.
+
+        :param data: The data read from a file, keyed by locale code.
+        :param previous: Data of a previous load of the same file, as returned by `load`.
+        :return: The same data.
+        """
+        return self._process(data, None, previous, compile=True)
+
+    def _read(self, filepath: str | Path) -> dict[str, Any]:
+        """Read a file with the loader of its extension."""
         filename = os.path.basename(filepath)
         extension = os.path.splitext(filename)[1]
         if not extension:
@@ -70,15 +149,11 @@ class Loader:
 
         if loader := self.loaders.get(extension.lower()):
             data: dict[str, Any] = loader.load(filepath)
+            if loader.precompiled:
+                return data
+
             for _, locale in data.items():
-                if isinstance(locale, list):
-                    for item in locale:
-                        self._validate(filepath, item)
-                        self._process_data(item)
-                elif isinstance(locale, dict):
-                    self._validate(filepath, locale)
-                    self._process_data(locale)
-                else:
+                if not isinstance(locale, (list, dict)):
                     self._throw(
                         f"Locale data in '{filename}' should be a dictionary or a list of dictionaries, "
                         f"but got {type(locale).__name__}",
@@ -94,94 +169,152 @@ class Loader:
                 UnsupportedFileExtensionError,
             )
 
-    def _validate(self, filepath: str | Path, data: dict | list, path: list[str | int] | None = None):
-        path = path or []
-        if isinstance(data, dict):
-            for key in data.keys():
-                if not isinstance(key, str) or not key.isidentifier():
-                    self._logger.warning(
-                        f"Key '{key}' is not a valid Python identifier. Call via dot notation is not possible. "
-                        f"Problem found at path: '{'.'.join(map(str, path + [key]))}' "
-                        f"in file: {filepath}",
-                    )
+    def _process(
+        self,
+        data: dict[str, Any],
+        filepath: str | Path | None,
+        previous: dict[str, Any] | None = None,
+        read: bool = False,
+        compile: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Apply the enabled stages to loaded data in place.
 
-                if isinstance(data[key], dict):
-                    self._validate(filepath, data[key], path + [key])
+        :param read: Run the stages of `read`: validation and macros.
+        :param compile: Run the stages of `compile_messages`: hooks and ICU messages.
+        """
+        icumf = self._icumf if compile and "icumf" in self.stages and isinstance(self._icumf, ICUMF) else None
+        run = _Pass(
+            filepath=filepath,
+            validate=read and "validate" in self.stages,
+            macros=read and "macros" in self.stages,
+            hooks=self.hooks if compile else (),
+            icumf=icumf,
+            messages=self._collect_messages(previous) if icumf and previous else None,
+        )
+        if not (run.validate or run.macros or run.hooks or run.icumf):
+            return data
 
-        elif isinstance(data, list):
-            for index, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    self._validate(filepath, item, path + [index])
+        for locale in data.values():
+            for item in locale if isinstance(locale, list) else (locale,):
+                if isinstance(item, (dict, list)) and not isinstance(item, CatalogDict):
+                    self._walk(run, item, None, None)
 
-    def _process_icumf(self, data: dict[Any, Any]):
-        """Recursively process data to parse strings using ICUMF."""
-        if not (isinstance(self._icumf, ICUMF)):
-            return
+        return data
 
-        for key, value in data.items():
-            if isinstance(value, dict):
-                self._process_data(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        self._process_data(item)
-                    elif isinstance(item, str):
-                        processed_item = self._icumf.parse(item)
-                        index = value.index(item)
-                        value[index] = processed_item
-
-            elif isinstance(value, str):
-                processed_value = self._icumf.parse(value)
-                data[key] = processed_value
-            else:
-                continue
+    def _walk(self, run: "_Pass", data: dict | list, path: tuple | None, scope: Macros | None):
+        """
+        Apply the stages of a run to a container and everything nested in it.
 
-    @staticmethod
-    def _process_macros(data_: dict[Any, Any]):
-        """Process macros in the data."""
-        keys = ["__macros__"]
-        for key in keys:
-            if macros := data_.get(key, None):
-                break
+        Every node is visited once. Paths are kept as (parent, key) links
+        and only joined when a warning is logged or a hook is called.
+        """
+        items: Iterable[tuple[Any, Any]]
+        if isinstance(data, dict):
+            if run.macros:
+                scope = self._get_macros(data, scope)
+            if run.validate:
+                self._validate(run.filepath, data, path)
+            items = data.items()
         else:
-            return
-
-        def replace_macros(data: dict[Any, Any]) -> Any:
-            nonlocal macros
-            if isinstance(data, dict):
-                for k, v in data.items():
-                    if isinstance(v, str):
-                        data[k] = replace_macros(data[k])
-                    else:
-                        replace_macros(v)
+            items = enumerate(data)
 
-            elif isinstance(data, list):
-                for index, item in enumerate(data):
-                    if isinstance(item, str):
-                        data[index] = replace_macros(data[index])
+        for key, value in items:
+            if isinstance(value, str):
+                processed: Any = value
+                if scope is not None:
+                    processed = scope.expand(processed)
+                if run.hooks:
+                    dotted = _dotted(path, key)
+                    for hook in run.hooks:
+                        processed = hook(processed, dotted)
+                if run.icumf is not None and isinstance(processed, str):
+                    processed = run.icumf.parse(processed, run.messages)
+                if processed is not value:
+                    data[key] = processed
+
+            elif isinstance(value, dict):
+                if isinstance(value, CatalogDict):
+                    continue
+                if run.icumf is not None and self._compile_plurals and _is_plural_dict(value):
+                    # forms are expanded before they are compiled, and only parsed one by one if they can't be
+                    self._walk(run._replace(icumf=None), value, (path, key), scope)
+                    if (compiled := self._compile_plural(value, run.messages)) is not None:
+                        data[key] = compiled
                     else:
-                        replace_macros(item)
+                        self._walk(
+                            _Pass(run.filepath, icumf=run.icumf, messages=run.messages), value, (path, key), None
+                        )
+                else:
+                    self._walk(run, value, (path, key), scope)
 
-            elif isinstance(data, str):
-                if "@" not in data:
-                    return data
+            elif isinstance(value, list):
+                self._walk(run, value, (path, key), scope)
+
+    @staticmethod
+    def _collect_messages(data: dict[str, Any]) -> dict[Any, CompiledMessage]:
+        """Index compiled messages by their source: the raw string, or the frozen plural dict for compiled plurals."""
+        messages: dict[Any, CompiledMessage] = {}
+        stack: list[dict | list] = [data]
+        while stack:
+            container = stack.pop()
+            for value in container.values() if isinstance(container, dict) else container:
+                if isinstance(value, CompiledPlural):
+                    if (key := _plural_key(value.forms)) is not None:
+                        messages[key] = value
+                elif isinstance(value, CompiledMessage):
+                    messages[value.raw] = value
+                elif isinstance(value, list) or (isinstance(value, dict) and not isinstance(value, CatalogDict)):
+                    stack.append(value)
 
-                for macro_key, macro_value in macros.items():
-                    if f"@{macro_key}" in data:
-                        data = data.replace(f"@{macro_key}", macro_value)
+        return messages
 
-                return data
+    def _compile_plural(
+        self, forms: dict[str, Any], messages: dict[Any, CompiledMessage] | None
+    ) -> CompiledPlural | None:
+        if not isinstance(self._icumf, ICUMF):
+            return None
+
+        if messages and (key := _plural_key(forms)) is not None:
+            if isinstance(compiled := messages.get(key), CompiledPlural):
+                return compiled
+
+        return self._icumf.compile_plural(forms)
+
+    def _validate(self, filepath: str | Path | None, data: dict, path: tuple | None):
+        """Warn about the keys of a dict that can't be accessed with dot notation."""
+        is_plural = _is_plural_dict(data)
+        for key in data:
+            if is_plural and isinstance(key, str) and key[:1] == "=":
+                # `=N` plural forms are not accessed by name
+                continue
+
+            if not isinstance(key, str) or not key.isidentifier():
+                self._logger.warning(
+                    f"Key '{key}' is not a valid Python identifier. Call via dot notation is not possible. "
+                    f"Problem found at path: '{_dotted(path, key)}' "
+                    f"in file: {filepath}",
+                )
 
+    def _get_macros(self, data: dict[Any, Any], parent: Macros | None) -> Macros | None:
+        """Pop the macro definitions of a dict and compile them on top of the enclosing ones."""
+        definitions: dict[Any, Any] = {}
+        for key in MACRO_KEYS:
+            if key not in data:
+                continue
+            if isinstance(value := data.pop(key), dict):
+                definitions.update(value)
             else:
-                # just in case
-                return data
+                self._throw(f"Macros must be defined as a dictionary, got {type(value).__name__}.", MacroError)
 
-        replace_macros(data_)
+        if not definitions:
+            return parent
 
-    def _process_data(self, data: dict[Any, Any]):
-        """Post-process loaded data."""
-        self._process_macros(data)
-        self._process_icumf(data)
+        try:
+            return Macros(definitions, parent)
+        except MacroError as e:
+            self._throw(f"{e} Macros of this scope are ignored.", MacroError)
+            return parent
 
     def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> dict:
         if self._strict:
@@ -189,3 +322,44 @@ class Loader:
         else:
             self._logger.log(lvl, msg)
             return {}
+
+
+class _Pass(NamedTuple):
+    """Stages applied by one traversal of loaded data."""
+
+    filepath: str | Path | None
+    validate: bool = False
+    macros: bool = False
+    hooks: tuple[Hook, ...] = ()
+    icumf: ICUMF | None = None
+    messages: dict[Any, CompiledMessage] | None = None
+
+
+def _dotted(path: tuple | None, key: Any) -> DottedPath:
+    """Join a (parent, key) path chain ending with `key`."""
+    keys = [key]
+    while path is not None:
+        path, parent_key = path
+        keys.append(parent_key)
+    return DottedPath(reversed(keys))
+
+
+def _plural_key(forms: dict[str, Any]) -> tuple | None:
+    """Return a hashable key of a plural dict, or None if some value is not hashable."""
+    key = tuple(forms.items())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+_worker_loaders: dict[tuple[bool, tuple[str, ...]], Loader] = {}
+
+
+def _read_file(filepath: str | Path, strict: bool, stages: Iterable[str] = STAGES) -> dict[str, dict[str, Any]]:
+    """Read a file in a worker process. See `Loader.read`."""
+    key = (strict, tuple(stages))
+    if (loader := _worker_loaders.get(key)) is None:
+        loader = _worker_loaders[key] = Loader(strict, icumf=False, stages=stages)
+    return loader.read(filepath)
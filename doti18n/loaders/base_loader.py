@@ -8,6 +8,8 @@ class BaseLoader(ABC):
 
     _LOADERS: dict = {}
     file_extension: tuple[str, ...] | str
+    # True, if files hold data that is already validated and processed (e.g., compiled catalogs)
+    precompiled: bool = False
 
     @abstractmethod
     def load(self, filepath: str | Path) -> dict[str, Any]:
@@ -0,0 +1,412 @@
+import logging
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NoReturn
+
+from ..errors import EmptyFileError, ParseError
+from ..icumf import CompiledMessage, CompiledPlural
+from ..icumf.nodes import FormatNode, MessageNode, Node, TagNode, TextNode
+from ..utils import _get_locale_code, _is_plural_dict
+from .base_loader import BaseLoader
+
+if TYPE_CHECKING:
+    from ..icumf import ICUMF
+
+MAGIC = b"D18N"
+VERSION = 1
+
+# magic, version, flags, string count, strings offset, records offset, root record offset
+_HEADER = struct.Struct("<4sHHIIII")
+_U32 = struct.Struct("<I")
+_PAIR = struct.Struct("<II")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_FORMAT = struct.Struct("<IIIBi")
+_MESSAGE = struct.Struct("<IIiI")
+_NO_STRING = 0xFFFFFFFF
+
+# value records
+T_NONE, T_STR, T_INT, T_FLOAT, T_BOOL, T_DICT, T_LIST, T_PLURAL, T_ICU, T_COMPILED_PLURAL = range(10)
+# AST nodes
+N_TEXT, N_FORMAT, N_MESSAGE, N_TAG = range(4)
+
+
+class _Encoded:
+    """A value that is not decoded yet: the offset of its record."""
+
+    __slots__ = ("offset",)
+
+    def __init__(self, offset: int):
+        self.offset = offset
+
+
+class CatalogDict(dict):
+    """
+    A mapping of a compiled catalog, decoded lazily.
+
+    Keys are known upfront, values are decoded on first access and kept.
+    """
+
+    __slots__ = ("catalog",)
+
+    def __init__(self, catalog: "Catalog", entries: list[tuple[str, int]]):
+        """Initialize the mapping with (key, record offset) entries."""
+        super().__init__((key, _Encoded(offset)) for key, offset in entries)
+        self.catalog = catalog
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return the value, decoding it on first access."""
+        value = dict.__getitem__(self, key)
+        if type(value) is _Encoded:
+            value = self.catalog.decode(value.offset)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for key if key is in the mapping, else default."""
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        """Iterate over the keys. Defined, so `dict(catalog_dict)` decodes values too."""
+        return dict.__iter__(self)
+
+    def items(self):
+        """Return decoded (key, value) pairs."""
+        return [(key, self[key]) for key in dict.keys(self)]
+
+    def values(self):
+        """Return decoded values."""
+        return [self[key] for key in dict.keys(self)]
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        """Remove the key and return its decoded value."""
+        if key not in self and default:
+            return default[0]
+        value = self[key]
+        dict.__delitem__(self, key)
+        return value
+
+    def __repr__(self) -> str:
+        """Return a representation without decoding the values."""
+        return f"{self.__class__.__name__}({list(dict.keys(self))})"
+
+
+class Catalog:
+    """
+    A compiled catalog, memory-mapped.
+
+    Strings are decoded from the string table on first use, and the records of
+    mappings only when their values are accessed. The mapped pages are shared
+    by every process that loads the same file.
+    """
+
+    def __init__(self, buffer: mmap.mmap | bytes, engine: "ICUMF | None" = None):
+        """
+        Initialize the catalog.
+
+        :param buffer: The catalog file contents.
+        :param engine: The ICUMF engine to compile messages with. None decodes messages as their raw strings.
+        :raises ValueError: If the buffer is not a compiled catalog of a supported version.
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("File is too short to be a compiled catalog.")
+
+        magic, version, _, count, strings_offset, records_offset, root = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("File is not a compiled catalog.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported catalog version {version}, expected {VERSION}.")
+
+        self.buffer = buffer
+        self.engine = engine
+        self._string_count = count
+        self._string_offsets = strings_offset
+        self._string_data = strings_offset + _U32.size * (count + 1)
+        self._records = records_offset
+        self._root = root
+        self._strings: dict[int, str] = {}
+
+    def root(self) -> Any:
+        """Decode the root of the catalog."""
+        return self.decode(self._root)
+
+    def string(self, index: int) -> str:
+        """Return a string of the string table."""
+        try:
+            return self._strings[index]
+        except KeyError:
+            start, end = _PAIR.unpack_from(self.buffer, self._string_offsets + _U32.size * index)
+            data = self._string_data
+            value = self._strings[index] = str(self.buffer[data + start : data + end], "utf-8")
+            return value
+
+    def decode(self, offset: int) -> Any:
+        """Decode the value record at `offset`."""
+        position = self._records + offset
+        tag = self.buffer[position]
+        position += 1
+        if tag == T_STR:
+            return self.string(_U32.unpack_from(self.buffer, position)[0])
+        elif tag == T_DICT:
+            return CatalogDict(self, self._entries(position))
+        elif tag == T_ICU:
+            raw_index, nodes_offset = _PAIR.unpack_from(self.buffer, position)
+            raw = self.string(raw_index)
+            if self.engine is None:
+                return raw
+            nodes, _ = self._nodes(self._records + nodes_offset)
+            return self.engine.compile(nodes, raw=raw)
+        elif tag == T_PLURAL:
+            return {key: self.decode(value) for key, value in self._entries(position)}
+        elif tag == T_COMPILED_PLURAL:
+            forms = self.decode(_U32.unpack_from(self.buffer, position)[0])
+            if self.engine is not None and (compiled := self.engine.compile_plural(forms)) is not None:
+                return compiled
+            return forms
+        elif tag == T_LIST:
+            (count,) = _U32.unpack_from(self.buffer, position)
+            offsets = struct.unpack_from(f"<{count}I", self.buffer, position + _U32.size)
+            return [self.decode(item) for item in offsets]
+
+        return self._scalar(tag, position, offset)
+
+    def _scalar(self, tag: int, position: int, offset: int) -> Any:
+        if tag == T_INT:
+            return _INT.unpack_from(self.buffer, position)[0]
+        elif tag == T_FLOAT:
+            return _FLOAT.unpack_from(self.buffer, position)[0]
+        elif tag == T_BOOL:
+            return bool(self.buffer[position])
+        elif tag == T_NONE:
+            return None
+
+        raise ValueError(f"Invalid catalog record at offset {offset}.")
+
+    def _entries(self, position: int) -> list[tuple[str, int]]:
+        (count,) = _U32.unpack_from(self.buffer, position)
+        position += _U32.size
+        entries = []
+        for _ in range(count):
+            key, value = _PAIR.unpack_from(self.buffer, position)
+            entries.append((self.string(key), value))
+            position += _PAIR.size
+        return entries
+
+    def _optional_string(self, index: int) -> str | None:
+        return None if index == _NO_STRING else self.string(index)
+
+    def _nodes(self, position: int) -> tuple[list[Node], int]:
+        """Decode a list of AST nodes. Return the nodes and the position after them."""
+        (count,) = _U32.unpack_from(self.buffer, position)
+        position += _U32.size
+        nodes: list[Node] = []
+        for _ in range(count):
+            kind = self.buffer[position]
+            position += 1
+            if kind == N_TEXT:
+                nodes.append(TextNode(self.string(_U32.unpack_from(self.buffer, position)[0])))
+                position += _U32.size
+            elif kind == N_FORMAT:
+                name, type_, style, is_hash, offset = _FORMAT.unpack_from(self.buffer, position)
+                position += _FORMAT.size
+                nodes.append(
+                    FormatNode(
+                        self.string(name),
+                        self._optional_string(type_),
+                        self._optional_string(style),
+                        bool(is_hash),
+                        offset,
+                    )
+                )
+            elif kind == N_MESSAGE:
+                name, type_, offset, option_count = _MESSAGE.unpack_from(self.buffer, position)
+                position += _MESSAGE.size
+                message = MessageNode(self.string(name), self.string(type_), offset=offset)
+                for _ in range(option_count):
+                    selector = self.string(_U32.unpack_from(self.buffer, position)[0])
+                    message.options[selector], position = self._nodes(position + _U32.size)
+                nodes.append(message)
+            elif kind == N_TAG:
+                name = self.string(_U32.unpack_from(self.buffer, position)[0])
+                children, position = self._nodes(position + _U32.size)
+                nodes.append(TagNode(name, children))
+            else:
+                raise ValueError(f"Invalid catalog node at offset {position - 1 - self._records}.")
+
+        return nodes, position
+
+
+class _CatalogWriter:
+    """Serializes processed locale data into the catalog format."""
+
+    def __init__(self):
+        self.strings: dict[str, int] = {}
+        self.records = bytearray()
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def optional_string(self, value: str | None) -> int:
+        return _NO_STRING if value is None else self.string(value)
+
+    def write(self, record: bytes) -> int:
+        offset = len(self.records)
+        self.records += record
+        return offset
+
+    def value(self, value: Any, path: tuple) -> int:
+        """Write the record of a value (children first) and return its offset."""
+        if isinstance(value, CompiledPlural):
+            forms = self.mapping(T_PLURAL, value.forms, path)
+            return self.write(bytes((T_COMPILED_PLURAL,)) + _U32.pack(forms))
+        elif isinstance(value, CompiledMessage):
+            nodes = self.write(self.nodes(value.nodes))
+            return self.write(bytes((T_ICU,)) + _PAIR.pack(self.string(value.raw), nodes))
+        elif isinstance(value, str):
+            return self.write(bytes((T_STR,)) + _U32.pack(self.string(value)))
+        elif isinstance(value, dict):
+            return self.mapping(T_PLURAL if _is_plural_dict(value) else T_DICT, value, path)
+        elif isinstance(value, (list, tuple)):
+            offsets = [self.value(item, (*path, index)) for index, item in enumerate(value)]
+            return self.write(bytes((T_LIST,)) + _U32.pack(len(offsets)) + struct.pack(f"<{len(offsets)}I", *offsets))
+        elif isinstance(value, bool):
+            return self.write(bytes((T_BOOL, value)))
+        elif isinstance(value, int):
+            return self.write(bytes((T_INT,)) + _INT.pack(value))
+        elif isinstance(value, float):
+            return self.write(bytes((T_FLOAT,)) + _FLOAT.pack(value))
+        elif value is None:
+            return self.write(bytes((T_NONE,)))
+
+        raise TypeError(f"Cannot compile value of type {type(value).__name__} at '{'.'.join(map(str, path))}'.")
+
+    def mapping(self, tag: int, value: dict, path: tuple) -> int:
+        entries = []
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Cannot compile non-string key {key!r} at '{'.'.join(map(str, path))}'.")
+            entries.append(_PAIR.pack(self.string(key), self.value(item, (*path, key))))
+        return self.write(bytes((tag,)) + _U32.pack(len(entries)) + b"".join(entries))
+
+    def nodes(self, nodes: list[Node] | tuple[Node, ...]) -> bytes:
+        parts = [_U32.pack(len(nodes))]
+        for node in nodes:
+            if isinstance(node, TextNode):
+                parts.append(bytes((N_TEXT,)) + _U32.pack(self.string(node.value)))
+            elif isinstance(node, FormatNode):
+                parts.append(
+                    bytes((N_FORMAT,))
+                    + _FORMAT.pack(
+                        self.string(node.name),
+                        self.optional_string(node.type),
+                        self.optional_string(node.style),
+                        node.is_hash,
+                        node.offset,
+                    )
+                )
+            elif isinstance(node, MessageNode):
+                parts.append(
+                    bytes((N_MESSAGE,))
+                    + _MESSAGE.pack(self.string(node.name), self.string(node.type), node.offset, len(node.options))
+                )
+                for selector, branch in node.options.items():
+                    parts.append(_U32.pack(self.string(selector)))
+                    parts.append(self.nodes(branch))
+            elif isinstance(node, TagNode):
+                parts.append(bytes((N_TAG,)) + _U32.pack(self.string(node.name)))
+                parts.append(self.nodes(node.children))
+            else:
+                raise TypeError(f"Cannot compile node of type {type(node).__name__}.")
+
+        return b"".join(parts)
+
+    def build(self, data: dict | list) -> bytes:
+        root = self.value(data, ())
+        encoded = [string.encode("utf-8") for string in self.strings]
+        offsets = [0]
+        for string in encoded:
+            offsets.append(offsets[-1] + len(string))
+
+        strings = struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+        header = _HEADER.pack(MAGIC, VERSION, 0, len(encoded), _HEADER.size, _HEADER.size + len(strings), root)
+        return header + strings + bytes(self.records)
+
+
+class D18nLoader(BaseLoader):
+    """
+    Loader for compiled catalogs (`.d18n`), built by `doti18n compile`.
+
+    Catalogs hold data after macros and ICU processing, so they are not
+    processed again. Files are memory-mapped and decoded lazily.
+    """
+
+    file_extension = ".d18n"
+    precompiled = True
+
+    def __init__(self, strict: bool = False):
+        """Initialize the D18nLoader class."""
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._strict = strict
+        # set by Loader, ICU messages are compiled with it
+        self.engine: ICUMF | None = None
+
+    def load(self, filepath: str | Path) -> dict[str, Any]:
+        """Map a compiled catalog into memory."""
+        filename = os.path.basename(filepath)
+        try:
+            with open(filepath, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return self._throw(f"Locale file '{filename}' is empty.", EmptyFileError)
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            data = Catalog(buffer, self.engine).root()
+        except FileNotFoundError:
+            return self._throw(f"Locale file '{filename}' not found during load.", FileNotFoundError)
+        except (ValueError, struct.error) as e:
+            return self._throw(f"Error parsing compiled catalog '{filename}': {e}", ParseError)
+
+        locale_code = _get_locale_code(filename)
+        self._logger.info(f"Loaded locale data for: '{locale_code}' from '{filename}'")
+        return {locale_code: data}
+
+    def load_with_comments(self, filepath: str | Path) -> dict | list[dict]:
+        """Load a compiled catalog. Catalogs don't keep comments."""
+        return self.load(filepath)
+
+    @staticmethod
+    def save(filepath: str | Path, data: dict | list):
+        """
+        Compile processed locale data into a catalog file.
+
+        The catalog is written to a temporary file and moved onto the target,
+        so processes that have the previous catalog mapped keep reading the old file.
+
+        :param filepath: The path of the catalog.
+        :param data: The data of one locale, after macros and ICU processing.
+        :raises TypeError: If the data contains a value that can't be compiled.
+        """
+        content = _CatalogWriter().build(data)
+        directory, filename = os.path.split(os.path.abspath(filepath))
+        # in the same directory, so the file can be renamed onto the target
+        temp_path = os.path.join(directory, f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, filepath)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR) -> dict | NoReturn:
+        if self._strict:
+            raise exc_type(msg)
+        else:
+            self._logger.log(lvl, msg)
+            return {}
@@ -1,7 +1,9 @@
 import logging
 import xml.etree.ElementTree as Et
+from collections.abc import Iterator
+from itertools import count
 from pathlib import Path
-from typing import Any, NoReturn
+from typing import Any, Literal, NoReturn
 from xml.etree.ElementTree import XMLParser
 
 from ..errors import (
@@ -12,18 +14,37 @@ from ..errors import (
 from ..utils import _get_locale_code
 from .base_loader import BaseLoader
 
+# ruff: noqa C901
 
-class Parser(Et.TreeBuilder):
-    """Custom XML parser to support comments extraction."""
 
-    def comment(self, data: str | None):
-        """Handle XML comments by treating them as special nodes in the tree."""
-        if not data:
-            return
+class _Node:
+    """An element that is being parsed, with the values of its children parsed so far."""
+
+    __slots__ = ("element", "parent", "is_list", "keep", "inline", "children", "kept", "lists")
+
+    def __init__(self, element: Et.Element, parent: "_Node | None", keep: bool):
+        self.element = element
+        self.parent = parent
+        self.is_list = element.attrib.get("list", "").lower() == "true"
+        # True, if the element's subtree is still needed to serialize an enclosing inline message
+        self.keep = keep
+        # True, while all children are inline tags
+        self.inline = True
+        self.children: list[tuple[Any, Any]] | None = None
+        # number of children still attached to the element; the next child is at this index
+        self.kept = 0
+        # explicit lists found in the subtree: (path, item tag)
+        self.lists: list[tuple[str, Any]] | None = None
 
-        self.start(Et.Comment, {})
-        self.data(data)
-        self.end(Et.Comment)  # type: ignore
+    @property
+    def path(self) -> str:
+        """Return the dotted path of the element, with `item` for list items."""
+        keys = []
+        node = self
+        while node.parent is not None:
+            keys.append("item" if node.parent.is_list else str(node.element.tag))
+            node = node.parent
+        return ".".join(reversed(keys))
 
 
 class XmlLoader(BaseLoader):
@@ -64,14 +85,19 @@ class XmlLoader(BaseLoader):
 
     def load(self, filepath: str | Path) -> dict[str, Any]:
         """Load and processes localization data from an XML file."""
+        return self._load(filepath, comments=False)
+
+    def load_with_comments(self, filepath: str | Path) -> dict | list[dict]:
+        """Load and process localization data from an XML file, preserving comments."""
+        return self._load(filepath, comments=True)
+
+    def _load(self, filepath: str | Path, comments: bool) -> dict[str, Any]:
         filepath = Path(filepath)
         filename = filepath.name
 
         try:
-            tree = Et.parse(filepath)
-            root = tree.getroot()
             locale_code = _get_locale_code(filename)
-            data = self._etree_to_dict(root, locale_code)
+            data, root_tag = self._parse(filepath, locale_code, comments)
 
         except Et.ParseError as e:
             return self._throw(f"Error parsing XML file '{filename}': {e}", ParseError)
@@ -89,40 +115,133 @@ class XmlLoader(BaseLoader):
                 InvalidLocaleDocumentError,
             )
 
-        self._root_tags[locale_code] = root.tag
+        self._root_tags[locale_code] = root_tag
         self._logger.info(f"Loaded locale data for: '{locale_code}' from '{filename}'")
         return {locale_code: data}
 
-    def load_with_comments(self, filepath: str | Path) -> dict | list[dict]:
-        """Load and process localization data from an XML file, preserving comments."""
-        filepath = Path(filepath)
-        filename = filepath.name
+    def _parse(self, filepath: Path, locale_code: str, comments: bool) -> tuple[dict | list | str, str]:
+        """
+        Parse a file incrementally, returning its data and the tag of its root.
+
+        Values are built as soon as their element ends, and the element is detached from the tree,
+        so memory holds the resulting data rather than the whole document. Only the elements
+        that may end up in an inline message (e.g., `Hello <b>World</b>`) are kept until it is serialized.
+        """
+        parser = XMLParser(target=Et.TreeBuilder(insert_comments=True)) if comments else None
+        events: tuple[Literal["start", "end", "comment"], ...] = (
+            ("start", "end", "comment") if comments else ("start", "end")
+        )
+        inline_tags = self.INLINE_TAGS
+        comment_ids = count()
+        stack: list[_Node] = []
+        # an empty comment is skipped, once its tail is known
+        blank: tuple[_Node, Et.Element] | None = None
+        value: dict | list | str = {}
+        root_tag = ""
+
+        for event, element in Et.iterparse(filepath, events, parser):
+            if blank is not None:
+                self._drop_comment(*blank)
+                blank = None
+
+            if event == "start":
+                if stack:
+                    parent = stack[-1]
+                    stack.append(_Node(element, parent, parent.keep or element.tag in inline_tags))
+                else:
+                    stack.append(_Node(element, None, False))
 
-        try:
-            parser = XMLParser(target=Parser())
-            tree = Et.parse(filepath, parser=parser)
-            root = tree.getroot()
-            locale_code = _get_locale_code(filename)
-            data = self._etree_to_dict(root, locale_code)
-            if not data:
-                return self._throw(f"Locale file '{filename}' is empty", EmptyFileError)
+            elif event == "end":
+                node = stack.pop()
+                if node.children is None and not node.is_list:
+                    value = element.text or ""
+                else:
+                    value = self._node_value(node, comment_ids)
+                if not stack:
+                    root_tag = str(element.tag)
+                    if locale_code and node.lists:
+                        self._explicit_lists.setdefault(locale_code, {}).update(node.lists)
+                    continue
+
+                parent = stack[-1]
+                if parent.children is None:
+                    parent.children = [(element.tag, value)]
+                else:
+                    parent.children.append((element.tag, value))
+                if parent.inline and element.tag not in inline_tags:
+                    parent.inline = False
+                if node.lists:
+                    if parent.lists is None:
+                        parent.lists = node.lists
+                    else:
+                        parent.lists.extend(node.lists)
+
+                if node.keep:
+                    parent.kept += 1
+                else:
+                    # the tree may be ahead of the events, so the child is not necessarily the last one
+                    del parent.element[parent.kept]
 
-            if not isinstance(data, dict):
-                return self._throw(
-                    f"File '{filename}': expected a dictionary of translations, but got {type(data).__name__}",
-                    InvalidLocaleDocumentError,
-                )
+            elif stack:  # comments outside the root are not part of the data
+                parent = stack[-1]
+                if not element.text:
+                    blank = (parent, element)
+                    continue
 
-            self._root_tags[locale_code] = root.tag
-            self._logger.info(f"Loaded locale data for: '{locale_code}' from '{filename}'")
-            return {locale_code: data}
+                if parent.children is None:
+                    parent.children = [(Et.Comment, element.text)]
+                else:
+                    parent.children.append((Et.Comment, element.text))
+                parent.inline = False
+                if parent.keep:
+                    parent.kept += 1
+                else:
+                    del parent.element[parent.kept]
 
-        except Et.ParseError as e:
-            return self._throw(f"Error parsing XML file '{filename}': {e}", ParseError)
-        except FileNotFoundError:
-            return self._throw(f"Locale file '{filename}' not found during load.", FileNotFoundError)
-        except Exception as e:
-            return self._throw(f"Unknown error loading '{filename}': {e}", type(e))
+        return value, root_tag
+
+    def _node_value(self, node: _Node, comment_ids: Iterator[int]) -> dict | list | str:
+        """Build the value of an element from its parsed children."""
+        if node.is_list:
+            if node.parent is not None:
+                item = node.children[0][0] if node.children else "item"
+                node.lists = [(node.path, item), *(node.lists or ())]
+            return [child for _, child in node.children or ()]
+
+        if node.children is None or node.inline:
+            # nested lists are a part of the message
+            node.lists = None
+            return self._get_inner_xml(node.element)
+
+        result: dict[str, Any] = {}
+        for tag, child in node.children:
+            if callable(tag):  # ElementTree uses callables for Comments
+                result[f"comment_{next(comment_ids)}"] = child
+                continue
+
+            child_tag = str(tag)
+            if child_tag in result:
+                existing = result[child_tag]
+                if isinstance(existing, list):
+                    existing.append(child)
+                else:
+                    result[child_tag] = [existing, child]
+            else:
+                result[child_tag] = child
+
+        return result
+
+    @staticmethod
+    def _drop_comment(parent: _Node, comment: Et.Element):
+        """Remove an empty comment from the tree, moving its tail to the preceding text."""
+        index = parent.kept
+        if comment.tail:
+            if index:
+                previous = parent.element[index - 1]
+                previous.tail = (previous.tail or "") + comment.tail
+            else:
+                parent.element.text = (parent.element.text or "") + comment.tail
+        del parent.element[index]
 
     def save(self, filepath: str | Path, data: dict[str, Any]):
         """Save localization data to an XML file."""
@@ -147,39 +266,6 @@ class XmlLoader(BaseLoader):
         with open(filepath, "wb") as f:
             tree.write(f, encoding="utf-8", xml_declaration=True)
 
-    def _etree_to_dict(self, node: Et.Element, locale_code: str = "", path: str = "") -> dict | list | str:
-        if node.attrib.get("list", "").lower() == "true":
-            if locale_code and path:
-                tag_dict = self._explicit_lists.setdefault(locale_code, {})
-                tag_dict[path] = node[0].tag if len(node) > 0 else "item"
-
-            return [self._etree_to_dict(child, locale_code, f"{path}.item") for child in node]
-
-        has_children = len(node) > 0
-        if not has_children or all(getattr(child, "tag", None) in self.INLINE_TAGS for child in node):
-            return self._get_inner_xml(node)
-
-        result: dict[str, Any] = {}
-        for child in node:
-            if callable(child.tag):  # ElementTree uses callables for Comments
-                result[f"comment_{id(child)}"] = self._etree_to_dict(child, locale_code, path)
-                continue
-
-            child_tag = str(child.tag)
-            child_path = f"{path}.{child_tag}" if path else child_tag
-            child_data = self._etree_to_dict(child, locale_code, child_path)
-
-            if child_tag in result:
-                existing = result[child_tag]
-                if isinstance(existing, list):
-                    existing.append(child_data)
-                else:
-                    result[child_tag] = [existing, child_data]
-            else:
-                result[child_tag] = child_data
-
-        return result
-
     def _dict_to_etree(self, data: dict[str, Any], parent: Et.Element, locale_code: str = "", path: str = ""):
         for key, value in data.items():
             if key.startswith("comment_"):
@@ -1,7 +1,9 @@
 import logging
 import os
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, NoReturn
+from typing import IO, Any, NoReturn
 
 from ..errors import EmptyFileError, ParseError
 from ..utils import _get_locale_code
@@ -18,32 +20,66 @@ except ImportError:
     ryaml = None  # type: ignore
 
 
+@lru_cache(maxsize=2)
+def _get_safe_loader(use_c_loader: bool) -> Any:
+    """Return libyaml's CSafeLoader if it's available and allowed, the pure-Python SafeLoader otherwise."""
+    if use_c_loader and getattr(yaml, "__with_libyaml__", False):
+        return yaml.CSafeLoader
+
+    return yaml.SafeLoader
+
+
 class YamlLoader(BaseLoader):
     """Loader for YAML files."""
 
     file_extension = (".yaml", ".yml")
+    # parse with libyaml when PyYAML is built with it. Set to False to force the pure-Python parser
+    use_c_loader: bool = True
 
-    def __init__(self, strict: bool = False):
-        """Initialize the YamlLoader class."""
+    def __init__(self, strict: bool = False, use_c_loader: bool | None = None):
+        """
+        Initialize the YamlLoader class.
+
+        :param strict: Whether to raise errors instead of logging them.
+        :param use_c_loader: Whether to parse with libyaml's CSafeLoader if it's available.
+                             None uses the `use_c_loader` class attribute.
+        """
         self._logger = logging.getLogger(self.__class__.__name__)
         self._strict = strict
+        if use_c_loader is not None:
+            self.use_c_loader = use_c_loader
+
+    @property
+    def safe_loader(self) -> Any:
+        """Return the PyYAML loader class files are parsed with."""
+        if not yaml:
+            raise ImportError("PyYAML package is not installed, cannot load YAML files.")
+
+        return _get_safe_loader(self.use_c_loader)
 
     def load(self, filepath: str | Path) -> dict[str, Any]:
         """Load and validate localization data from a YAML file."""
         if not yaml:
             raise ImportError("PyYAML package is not installed, cannot load YAML files.")
 
+        safe_loader = self.safe_loader
+        return self._load(filepath, lambda stream: yaml.load_all(stream, Loader=safe_loader), yaml.YAMLError)
+
+    def _load(
+        self,
+        filepath: str | Path,
+        load_all: Callable[[IO[str]], Iterator[Any]],
+        error_type: type[Exception],
+    ) -> dict[str, Any]:
         filename = os.path.basename(filepath)
-        # noinspection PyUnresolvedReferences
         try:
             with open(filepath, encoding="utf-8") as f:
                 locale_code = _get_locale_code(filename)
-                # noinspection PyUnresolvedReferences
-                data = list(yaml.safe_load_all(f))
+                data = list(load_all(f))
 
         except FileNotFoundError:
             self._throw(f"Locale file '{filename}' not found during load.", FileNotFoundError)
-        except yaml.YAMLError as e:
+        except error_type as e:
             self._throw(f"Error parsing YAML file '{filename}': {e}", ParseError)
         except Exception as e:
             self._throw(f"Unknown error loading '{filename}': {e}", type(e))
@@ -59,23 +95,13 @@ class YamlLoader(BaseLoader):
 
     def load_with_comments(self, filepath: str | Path) -> dict | list[dict]:
         """Load a YAML file while preserving comments."""
-        global yaml
         if not ryaml:
             raise ImportError("ruamel.yaml package is not installed, cannot load YAML files with comments.")
 
         if not yaml:
             raise ImportError("PyYAML package is not installed, cannot load YAML files.")
 
-        _yaml = yaml
-        try:
-            yaml = ryaml.YAML(typ="rt")  # type: ignore
-            yaml.safe_load_all = yaml.load_all  # type: ignore
-            yaml.YAMLError = ryaml.YAMLError  # type: ignore
-            data = self.load(filepath)
-        finally:
-            yaml = _yaml
-
-        return data
+        return self._load(filepath, ryaml.YAML(typ="rt").load_all, ryaml.YAMLError)
 
     @staticmethod
     def save(filepath: str | Path, data: dict[str, dict]):
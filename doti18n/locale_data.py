@@ -1,12 +1,131 @@
 import logging
 import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from .errors import DefaultLocaleNotLoadedError, LocaleNotLoadedError
-from .loaders import Loader
+from .loaders import Loader, _read_file
 from .locale_translator import LocaleTranslator
-from .utils import _deep_merge
+from .utils import _NOT_FOUND, _deep_merged, _get_locale_code
+
+
+class _Stat(NamedTuple):
+    """Modification time and size of a file. For a namespace directory, also those of its files."""
+
+    mtime: int
+    size: int
+    files: tuple[tuple[str, int, int], ...] | None = None
+
+
+def _file_stat(path: str) -> _Stat | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _Stat(stat.st_mtime_ns, stat.st_size)
+
+
+_PENDING = object()
+
+
+class _NamespaceDict(dict):
+    """
+    Top-level data of a locale stored as a directory, one namespace per file (e.g., `en/admin.yaml` -> `admin`).
+
+    Namespaces are known upfront, and the files of a namespace are loaded on its first access.
+    """
+
+    __slots__ = ("files", "loaded", "_load", "_previous", "_lock")
+
+    def __init__(self, files: dict[str, list[str]], load: Callable[[list[str], dict | None], Any]):
+        """
+        Initialize the mapping.
+
+        :param files: Namespace -> paths of its files.
+        :param load: Function to load the files of a namespace with, given the data of its previous version.
+        """
+        super().__init__((name, _PENDING) for name in files)
+        self.files = files
+        self.loaded: dict[str, tuple[_Stat | None, ...]] = {}  # namespace -> stats of its files when they were loaded
+        self._load = load
+        self._previous: dict[str, dict] = {}  # namespace -> data of its previous version, to reuse compiled messages
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return the namespace, loading its files on first access."""
+        value = dict.__getitem__(self, key)
+        if value is _PENDING:
+            with self._lock:
+                if (value := dict.__getitem__(self, key)) is _PENDING:
+                    paths = self.files[key]
+                    self.loaded[key] = tuple(_file_stat(path) for path in paths)
+                    value = self._load(paths, self._previous.pop(key, None))
+                    dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the namespace if it exists, else default."""
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        """Iterate over the namespace names. Defined, so `dict(namespace_dict)` loads namespaces too."""
+        return dict.__iter__(self)
+
+    def items(self):
+        """Return (name, namespace) pairs, loading all namespaces."""
+        return [(key, self[key]) for key in dict.keys(self)]
+
+    def values(self):
+        """Return all namespaces, loading them."""
+        return [self[key] for key in dict.keys(self)]
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        """Remove the namespace and return it."""
+        if key not in self and default:
+            return default[0]
+        value = self[key]
+        dict.__delitem__(self, key)
+        return value
+
+    def refresh(self, files: dict[str, list[str]], stats: dict[str, _Stat]) -> "_NamespaceDict":
+        """
+        Return a copy for the namespace files now on disk.
+
+        Loaded namespaces whose files didn't change are kept as they are. Changed ones are
+        loaded again on first access, reusing the compiled messages of their previous version.
+
+        :param files: Namespace -> paths of its files.
+        :param stats: Path -> stat of every file.
+        """
+        namespaces = _NamespaceDict(files, self._load)
+        for name, paths in files.items():
+            value = dict.get(self, name, _PENDING)
+            if value is _PENDING:
+                if name in self._previous:
+                    namespaces._previous[name] = self._previous[name]
+            elif self.loaded.get(name) == tuple(stats.get(path) for path in paths):
+                dict.__setitem__(namespaces, name, value)
+                namespaces.loaded[name] = self.loaded[name]
+            else:
+                namespaces._previous[name] = {name: value}
+
+        return namespaces
+
+    def __repr__(self) -> str:
+        """Return a representation without loading the namespaces."""
+        loaded = [key for key, value in dict.items(self) if value is not _PENDING]
+        return f"{self.__class__.__name__}({list(dict.keys(self))}, loaded={loaded})"
+
+
+class _Catalog(NamedTuple):
+    """Loaded locale data and the translators built from it. Replaced as a whole on reload."""
+
+    raw_translations: dict[str, dict[str, Any] | None]
+    translators: dict[str, LocaleTranslator]
 
 
 class LocaleData:
@@ -23,6 +142,8 @@ class LocaleData:
         strict: bool = False,
         preload: bool = True,
         loader: Loader | None = None,
+        workers: int | None = None,
+        executor: str = "thread",
     ):
         """
         Initialize the LocaleData manager.
@@ -34,9 +155,18 @@ class LocaleData:
                        (default: False).
         :param preload: If `True`, load all translations at initialization.
                         Not recommended to use with large locale directories.
-                        Instead, you can use LocaleData.get("filename") to load individual locale.
+                        Otherwise, locales are loaded on first access with `get_locale()` or `[]`.
                         (default: True)
+        :param loader: The loader to load files with.
+        :param workers: Load files concurrently with this many workers. None loads them one by one.
+                        Files are merged in the same order either way. (default: None)
+        :param executor: "thread" to load files in threads (for I/O-bound loading), or "process"
+                         to parse them in worker processes (for CPU-bound formats like YAML).
+                         Worker processes read files with a default `Loader`, ICU messages are
+                         compiled in this process. (default: "thread")
         """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor '{executor}'. Use 'thread' or 'process'.")
         if not loader:
             loader = Loader(strict)
 
@@ -45,8 +175,18 @@ class LocaleData:
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
         self._loader = loader
         self._strict = strict
-        self._raw_translations: dict[str, dict[str, Any] | None] = {}
-        self._locale_translators_cache: dict[str, LocaleTranslator] = {}
+        self._workers = workers
+        self._executor = executor
+        self._preload = preload
+        self._catalog = _Catalog({}, {})
+        # (mtime, size) of every loaded file and the data it held, to reload only changed files
+        self._file_stats: dict[str, _Stat] = {}
+        self._file_data: dict[str, list[tuple[str, Any]]] = {}
+        # locale code -> paths of its files, built from one directory scan on first use
+        self._index: dict[str, list[str]] | None = None
+        self._lock = threading.RLock()
+        self._watcher: threading.Thread | None = None
+        self._watch_stopped = threading.Event()
         if preload:
             self._load_all_translations()
 
@@ -55,9 +195,10 @@ class LocaleData:
             self._throw(f"Locale directory '{self.path}' does not exist.", FileNotFoundError)
             return
 
-        for filename in os.listdir(self.path):
-            data = self._loader.load(os.path.join(self.path, filename))
-            self._process_data(data)
+        # sorted, so files of the same locale are always merged in the same order
+        paths = [os.path.join(self.path, filename) for filename in sorted(os.listdir(self.path))]
+        # directories are namespaced locales, if they hold locale files
+        self._add_files([path for path in paths if not os.path.isdir(path) or self._stat(path) is not None])
 
         if not any(self._raw_translations.values()):
             self._throw(f"No localization files found or successfully loaded from '{self.path}'.", LocaleNotLoadedError)
@@ -76,20 +217,340 @@ class LocaleData:
                 DefaultLocaleNotLoadedError,
             )
 
-    def _process_data(self, data: dict[str, dict[str, Any]] | list[tuple[str, dict[str, Any]]]):
-        if isinstance(data, dict):
-            for locale_code, locale_data in data.items():
-                if locale_code in self._raw_translations:
-                    _deep_merge(locale_data, self._raw_translations[locale_code])
-                else:
-                    self._raw_translations[locale_code] = locale_data
+    def _load_files(
+        self, paths: list[str], previous: list[dict[str, Any] | None] | None = None
+    ) -> Iterable[dict[str, Any]]:
+        """
+        Load files, concurrently if workers are configured. Results are returned in the order of `paths`.
 
+        :param paths: Paths of the files to load.
+        :param previous: Data of the previous load of each file, to compile only the changed messages.
+        """
+        # custom loaders may only accept a path
+        args: list[Iterable[Any]] = [paths] if previous is None else [paths, previous]
+        if not self._workers or self._workers < 2 or len(paths) < 2:
+            return map(self._loader.load, *args)
+
+        workers = min(self._workers, len(paths))
+        if self._executor == "process":
+            # compiled catalogs are mapped into memory and run by the engine of this process, so they're loaded here
+            parsed = [path for path in paths if not self._loader.is_precompiled(path)]
+            read = {}
+            if parsed:
+                with ProcessPoolExecutor(min(workers, len(parsed))) as pool:
+                    read = dict(
+                        zip(parsed, pool.map(_read_file, parsed, repeat(self._strict), repeat(self._loader.stages)))
+                    )
+            return [
+                (self._loader.compile_messages(read[path], *rest) if path in read else self._loader.load(path, *rest))
+                for path, *rest in zip(*args)
+            ]
+
+        with ThreadPoolExecutor(workers) as pool:
+            return list(pool.map(self._loader.load, *args))
+
+    def _load_sources(
+        self,
+        paths: list[str],
+        stats: dict[str, _Stat | None],
+        previous: dict[str, dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Load locale files and namespace directories. Results are returned in the order of `paths`.
+
+        :param paths: Paths of the files and directories to load.
+        :param stats: Their stats, as returned by `_stat`.
+        :param previous: Data of their previous load, to compile only the changed messages.
+        """
+        directories = {path: stat for path in paths if (stat := stats.get(path)) is not None and stat.files is not None}
+        files = [path for path in paths if path not in directories]
+        results = dict(
+            zip(files, self._load_files(files, None if previous is None else [previous.get(path) for path in files]))
+        )
+        for path, stat in directories.items():
+            results[path] = self._load_namespaces(path, stat, (previous or {}).get(path))
+
+        return [results[path] for path in paths]
+
+    def _load_namespaces(self, path: str, stat: _Stat, previous: dict[str, Any] | None) -> dict[str, Any]:
+        """Create the namespaces of a locale directory. Their files are loaded on first access."""
+        files: dict[str, list[str]] = {}
+        stats: dict[str, _Stat] = {}
+        for name, mtime, size in stat.files or ():
+            filepath = os.path.join(path, name)
+            files.setdefault(os.path.splitext(name)[0], []).append(filepath)
+            stats[filepath] = _Stat(mtime, size)
+
+        locale_code = os.path.basename(path).lower()
+        old = (previous or {}).get(locale_code)
+        if isinstance(old, _NamespaceDict):
+            return {locale_code: old.refresh(files, stats)}
+        return {locale_code: _NamespaceDict(files, self._load_namespace)}
+
+    def _load_namespace(self, paths: list[str], previous: dict | None) -> Any:
+        """Load the files of a namespace and merge them in the order of their names."""
+        data = _NOT_FOUND
+        for path in paths:
+            for _, value in self._get_items(
+                self._loader.load(path) if previous is None else self._loader.load(path, previous)
+            ):
+                data = value if data is _NOT_FOUND else _deep_merged(value, data)
+
+        return {} if data is _NOT_FOUND else data
+
+    def _add_files(self, paths: list[str]):
+        """
+        Load files and merge their data into a new catalog.
+
+        Like `reload`, the catalog is published at once, so lock-free readers never see a locale
+        whose files are only partly merged.
+        """
+        stats = {path: self._stat(path) for path in paths}
+        with self._lock:
+            catalog = self._catalog
+            raw_translations = dict(catalog.raw_translations)
+            affected: set[str] = set()
+            for path, data in zip(paths, self._load_sources(paths, stats)):
+                items = self._get_items(data)
+                if (stat := stats[path]) is not None and (stat.files is not None or self._is_supported(path)):
+                    self._file_stats[path] = stat
+                    self._file_data[path] = items
+                self._process_data(items, raw_translations)
+                affected.update(locale_code for locale_code, _ in items)
+
+            # every translator holds the data of the default locale
+            translators = {}
+            if self.default_locale not in affected:
+                translators = {code: t for code, t in catalog.translators.items() if code not in affected}
+            self._catalog = _Catalog(raw_translations, translators)
+
+    def _process_data(
+        self,
+        data: dict[str, dict[str, Any]] | list[tuple[str, dict[str, Any]]],
+        raw_translations: dict[str, dict[str, Any] | None],
+    ):
+        for locale_code, locale_data in self._get_items(data):
+            if locale_code in raw_translations:
+                # merged into a copy, so the data of every file stays as it was loaded
+                raw_translations[locale_code] = _deep_merged(locale_data, raw_translations[locale_code])
+            else:
+                raw_translations[locale_code] = locale_data
+
+    @staticmethod
+    def _get_items(data: dict[str, Any] | list[tuple[str, Any]] | None) -> list[tuple[str, Any]]:
+        if isinstance(data, dict):
+            return list(data.items())
         elif isinstance(data, list):
-            for locale_code, locale_data in data:
-                if locale_code in self._raw_translations:
-                    _deep_merge(locale_data, self._raw_translations[locale_code])
+            return list(data)
+        return []
+
+    def _is_supported(self, path: str) -> bool:
+        return os.path.splitext(path)[1].lower() in self._loader.get_supported_extensions()
+
+    def _stat(self, path: str) -> _Stat | None:
+        """Return the stat of a locale file, or of a namespace directory with its files."""
+        if not os.path.isdir(path):
+            return _file_stat(path)
+
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file() and self._is_supported(entry.name):
+                        stat = entry.stat()
+                        files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            return None
+
+        # directories without locale files are not locales
+        return _Stat(0, 0, tuple(sorted(files))) if files else None
+
+    def _scan(self) -> dict[str, _Stat]:
+        """Return the stats of every supported file and namespace directory in the locale directory."""
+        stats: dict[str, _Stat] = {}
+        try:
+            entries = os.scandir(self.path)
+        except OSError:
+            return stats
+
+        with entries:
+            for entry in entries:
+                path = os.path.join(self.path, entry.name)
+                if entry.is_file() and self._is_supported(path):
+                    stat = entry.stat()
+                    stats[path] = _Stat(stat.st_mtime_ns, stat.st_size)
+                elif entry.is_dir() and (directory_stat := self._stat(path)) is not None:
+                    stats[path] = directory_stat
+
+        return stats
+
+    @staticmethod
+    def _get_source_locale(path: str, stat: _Stat) -> str:
+        """Return the locale code of a locale file (`en.yaml`) or a namespace directory (`en/`)."""
+        name = os.path.basename(path)
+        return name.lower() if stat.files is not None else _get_locale_code(name)
+
+    def _build_index(self, stats: dict[str, _Stat]) -> dict[str, list[str]]:
+        index: dict[str, list[str]] = {}
+        for path in sorted(stats):
+            index.setdefault(self._get_source_locale(path, stats[path]), []).append(path)
+        return index
+
+    def _get_index(self) -> dict[str, list[str]]:
+        if (index := self._index) is None:
+            with self._lock:
+                if (index := self._index) is None:
+                    index = self._index = self._build_index(self._scan())
+        return index
+
+    def refresh_index(self) -> list[str]:
+        """
+        Scan the locale directory again and update the index of locale files.
+
+        The index maps locale codes to their files and drives lazy loading: with `preload=False`,
+        only the files of the requested locales (and of the default one) are ever read.
+        It's built on first use, so refresh it when locale files are added or removed.
+        `reload` refreshes it too.
+
+        :return: Codes of the locales found in the directory, sorted.
+        """
+        with self._lock:
+            self._index = self._build_index(self._scan())
+            return sorted(self._index)
+
+    @property
+    def available_locales(self) -> list[str]:
+        """
+        Return the codes of the locales that have files in the locale directory, loaded or not.
+
+        :return: A sorted list of normalized locale codes (e.g., ['en', 'fr']).
+        """
+        return sorted(self._get_index())
+
+    def _load_indexed(self, locale_code: str) -> bool:
+        """Load the files of a locale that are not loaded yet. Return False, if the locale has no files."""
+        if not (paths := self._get_index().get(locale_code)):
+            return False
+
+        with self._lock:
+            if paths := [path for path in paths if path not in self._file_stats]:
+                self._add_files(paths)
+        return True
+
+    def reload(self) -> list[str]:
+        """
+        Reload locale files that changed on disk since they were loaded.
+
+        Files are compared by modification time and size. Only changed, added and removed files
+        are loaded again; locales they don't hold keep their data and translators. Messages of a
+        changed file are compiled again only if their source changed, the others are reused
+        together with their render caches. Changed namespace files are loaded again on first access.
+
+        The new state is published at once, so a translator obtained before or during the reload
+        always sees one consistent catalog, either the old or the new one.
+
+        New files are picked up for all locales if the data was preloaded, or for the loaded ones otherwise.
+
+        :return: Codes of the reloaded locales, sorted.
+        """
+        with self._lock:
+            catalog = self._catalog
+            stats = self._scan()
+            if self._index is not None:
+                self._index = self._build_index(stats)
+            changed = [path for path, stat in self._file_stats.items() if stats.get(path) != stat]
+            added = [
+                path
+                for path, stat in stats.items()
+                if path not in self._file_stats
+                and (self._preload or self._get_source_locale(path, stat) in catalog.raw_translations)
+            ]
+            if not changed and not added:
+                return []
+
+            file_stats = dict(self._file_stats)
+            file_data = dict(self._file_data)
+            affected: set[str] = set()
+            previous: dict[str, dict[str, Any]] = {}
+            for path in changed:
+                del file_stats[path]
+                previous[path] = dict(file_data.pop(path))
+                affected.update(previous[path])
+
+            paths = sorted(path for path in (*changed, *added) if path in stats)
+            for path, data in zip(paths, self._load_sources(paths, dict(stats), previous)):
+                file_stats[path] = stats[path]
+                file_data[path] = self._get_items(data)
+                affected.update(locale_code for locale_code, _ in file_data[path])
+
+            raw_translations = dict(catalog.raw_translations)
+            for locale_code in affected:
+                if (locale_data := self._merge_files(file_data, locale_code)) is _NOT_FOUND:
+                    raw_translations.pop(locale_code, None)
                 else:
-                    self._raw_translations[locale_code] = locale_data
+                    raw_translations[locale_code] = locale_data
+
+            # every translator holds the data of the default locale
+            translators = {}
+            if self.default_locale not in affected:
+                translators = {code: t for code, t in catalog.translators.items() if code not in affected}
+
+            self._file_stats, self._file_data = file_stats, file_data
+            self._catalog = _Catalog(raw_translations, translators)
+
+        self._logger.info(f"Reloaded locales: {', '.join(sorted(affected))}.")
+        return sorted(affected)
+
+    @staticmethod
+    def _merge_files(file_data: dict[str, list[tuple[str, Any]]], locale_code: str) -> Any:
+        """Merge the data of a locale from all files holding it, in the order of their names."""
+        merged = _NOT_FOUND
+        for path in sorted(file_data):
+            for code, locale_data in file_data[path]:
+                if code == locale_code:
+                    merged = locale_data if merged is _NOT_FOUND else _deep_merged(locale_data, merged)
+
+        return merged
+
+    def watch(self, interval: float = 1.0):
+        """
+        Reload changed files in a background thread, polling the locale directory every `interval` seconds.
+
+        Reload errors are logged, and the previous data stays in use until the files are fixed.
+
+        :param interval: Seconds between two checks. (default: 1.0)
+        """
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+
+            self._watch_stopped.clear()
+            self._watcher = threading.Thread(
+                target=self._watch, args=(interval,), name=f"{self.__class__.__name__}-watcher", daemon=True
+            )
+            self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the thread started by `watch` and wait for it to finish."""
+        self._watch_stopped.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self, interval: float):
+        while not self._watch_stopped.wait(interval):
+            try:
+                self.reload()
+            except Exception as e:
+                self._logger.error(f"Failed to reload locale files from '{self.path}': {e}")
+
+    @property
+    def _raw_translations(self) -> dict[str, dict[str, Any] | None]:
+        return self._catalog.raw_translations
+
+    @property
+    def _locale_translators_cache(self) -> dict[str, LocaleTranslator]:
+        return self._catalog.translators
 
     def __getitem__(self, locale_code: str | None) -> LocaleTranslator:
         """
@@ -107,10 +568,19 @@ class LocaleData:
             locale_code = self.default_locale
 
         normalized_locale_code = locale_code.lower()
-        if normalized_locale_code in self._locale_translators_cache:
-            return self._locale_translators_cache[normalized_locale_code]
-
-        current_locale_data = self._raw_translations.get(normalized_locale_code)
+        # a snapshot, so the translator is built from one catalog even if it's reloaded meanwhile
+        catalog = self._catalog
+        if normalized_locale_code in catalog.translators:
+            return catalog.translators[normalized_locale_code]
+
+        if not self._preload and not (
+            normalized_locale_code in catalog.raw_translations and self.default_locale in catalog.raw_translations
+        ):
+            self._load_indexed(normalized_locale_code)
+            self._load_indexed(self.default_locale)
+            catalog = self._catalog
+
+        current_locale_data = catalog.raw_translations.get(normalized_locale_code)
         if not isinstance(current_locale_data, (dict, list)):
             self._logger.warning(
                 f"Locale '{locale_code}' was not found or root is not a dict or list. "
@@ -118,12 +588,12 @@ class LocaleData:
                 f"Falling back to default locale '{self.default_locale}'.",
             )
 
-        default_locale_data = self._raw_translations.get(self.default_locale)
+        default_locale_data = catalog.raw_translations.get(self.default_locale)
         translator = LocaleTranslator(
             normalized_locale_code, current_locale_data, default_locale_data, self.default_locale, strict=self._strict
         )
 
-        self._locale_translators_cache[normalized_locale_code] = translator
+        catalog.translators[normalized_locale_code] = translator
         return translator
 
     def __contains__(self, locale_code: str) -> bool:
@@ -173,24 +643,27 @@ class LocaleData:
             default value.
         """
         locale_code = locale_code.lower()
-        if locale_code in self._locale_translators_cache:
-            return self._locale_translators_cache[locale_code]
-        elif locale_code in self.loaded_locales and isinstance(self._raw_translations[locale_code], (dict, list)):
+        catalog = self._catalog
+        if locale_code in catalog.translators:
+            return catalog.translators[locale_code]
+        elif isinstance(catalog.raw_translations.get(locale_code), (dict, list)):
             _t = LocaleTranslator(
                 locale_code,
-                self._raw_translations[locale_code],
-                self._raw_translations.get(self.default_locale, {}),
+                catalog.raw_translations[locale_code],
+                catalog.raw_translations.get(self.default_locale, {}),
                 self.default_locale,
                 strict=self._strict,
             )
-            self._locale_translators_cache[locale_code] = _t
+            catalog.translators[locale_code] = _t
             return _t
 
-        self._ensure_locale_loaded(locale_code)
-        if locale_code != self.default_locale:
-            self._ensure_locale_loaded(self.default_locale)
+        with self._lock:
+            self._ensure_locale_loaded(locale_code)
+            if locale_code != self.default_locale:
+                self._ensure_locale_loaded(self.default_locale)
+            catalog = self._catalog
 
-        locale_data = self._raw_translations.get(locale_code, None)
+        locale_data = catalog.raw_translations.get(locale_code, None)
         if not locale_data:
             self._throw(
                 f"Locale was not found or root is not a dictionary "
@@ -198,7 +671,7 @@ class LocaleData:
                 LocaleNotLoadedError,
             )
 
-        default_data = self._raw_translations.get(self.default_locale, None)
+        default_data = catalog.raw_translations.get(self.default_locale, None)
         if not default_data:
             self._throw(
                 f"Default locale was not found or root is not a dictionary "
@@ -209,7 +682,7 @@ class LocaleData:
             return default
 
         _t = LocaleTranslator(locale_code, locale_data, default_data, self.default_locale, strict=self._strict)
-        self._locale_translators_cache[locale_code] = _t
+        catalog.translators[locale_code] = _t
         return _t
 
     def _ensure_locale_loaded(self, locale_code: str):
@@ -217,20 +690,11 @@ class LocaleData:
         if locale_code in self._locale_translators_cache:
             return None
 
-        found_path = None
-        for extension in self._loader.get_supported_extensions():
-            filepath = os.path.join(self.path, f"{locale_code}{extension}")
-            if os.path.exists(filepath):
-                found_path = filepath
-                break
-
-        if not found_path:
+        if not self._load_indexed(locale_code):
             return self._throw(
                 f"Locale file for locale: '{locale_code}' not found or have not supported extension.", FileNotFoundError
             )
 
-        data = self._loader.load(found_path)
-        self._process_data(data)
         return True
 
     def _throw(self, msg: str, exc_type: type, lvl: int = logging.ERROR):
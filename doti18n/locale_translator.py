@@ -1,13 +1,17 @@
 import logging
 from collections.abc import Callable
+from decimal import Decimal
 from typing import Any, SupportsIndex
 
 from babel import Locale
 
+from .diagnostics import DottedPath, diagnostics
+from .icumf import BoundMessage, CompiledMessage, CompiledPlural, _RenderKey
 from .utils import (
     _NOT_FOUND,
     _get_value_by_path_single,
     _is_plural_dict,
+    _plural_operand,
 )
 from .wrapped import (
     ListWrapper,
@@ -60,8 +64,13 @@ class LocaleTranslator:
             self._default_plural_func = self._load_plural_func(default_locale_code)
 
         self._ordinal_func = Locale(locale_code.replace("-", "_")).ordinal_form
+        self._bound_messages: dict[CompiledMessage, BoundMessage] = {}
+        # translator of the default locale, created on first use to render compiled plurals found there
+        self._default_translator: LocaleTranslator | None = None
+        # render cache key, created once since it's needed on every cached render
+        self._render_key = _RenderKey(self)
 
-    def _load_plural_func(self, code: str) -> Callable[[int], str]:
+    def _load_plural_func(self, code: str) -> Callable[[int | Decimal], str]:
         """Help to safely load Babel plural function."""
         try:
             return Locale(code.replace("-", "_")).plural_form
@@ -87,16 +96,22 @@ class LocaleTranslator:
 
         value_from_default = _get_value_by_path_single(path, self._default_data)
         if value_from_default is not _NOT_FOUND:
-            self._logger.warning(
-                f"Fallback for key '{'.'.join(list(map(str, path)))}' "
-                f"from '{self.locale_code}' "
-                f"to '{self._default_locale_code}'"
+            key_path = DottedPath(path)
+            diagnostics.record(
+                "fallback",
+                self.locale_code,
+                key_path,
+                "Fallback for key '%s' from '%s' to '%s'",
+                key_path,
+                self.locale_code,
+                self._default_locale_code,
+                source=self._logger,
             )
             return value_from_default, self._default_locale_code
 
         return _NOT_FOUND, None
 
-    def _get_plural_form_key(self, count: int, locale_code: str | None) -> str:
+    def _get_plural_form_key(self, count: int | Decimal, locale_code: str | None) -> str:
         """
         Determine the plural form key based on a number and locale code.
 
@@ -106,15 +121,18 @@ class LocaleTranslator:
         :return: The plural form key (e.g., 'one', 'few', 'many', 'other').
                  Returns 'other' as a fallback in case of errors.
         """
+        if count < 0:
+            count = -count
+
         if locale_code is None or locale_code == self.locale_code:
-            return self._main_plural_func(abs(count))
+            return self._main_plural_func(count)
 
         if locale_code == self._default_locale_code:
-            return self._default_plural_func(abs(count))
+            return self._default_plural_func(count)
 
         # This is just in case
         try:
-            return Locale(locale_code.replace("-", "_")).plural_form(abs(count))
+            return Locale(locale_code.replace("-", "_")).plural_form(count)
         except Exception as e:
             self._logger.warning(f"Failed to determine plural form for locale '{locale_code}': {e}")
             return "other"
@@ -122,7 +140,7 @@ class LocaleTranslator:
     def _get_plural_template(
         self,
         path: list,
-        count: int,
+        count: int | Decimal,
         current_plural_dict: dict[str, Any],
         current_plural_locale_code: str | None,
     ) -> str | None:
@@ -148,6 +166,8 @@ class LocaleTranslator:
 
         if template is None:
             default_plural_dict = _get_value_by_path_single(path, self._default_data)
+            if isinstance(default_plural_dict, CompiledPlural):
+                default_plural_dict = default_plural_dict.forms
             if (
                 default_plural_dict is not None
                 and isinstance(default_plural_dict, dict)
@@ -174,7 +194,7 @@ class LocaleTranslator:
         :raises AttributeError: If a template for a plural form is not a string.
         """
         if isinstance(value, str):
-            return StringWrapper(value)
+            return StringWrapper(value, self.locale_code)
         elif isinstance(value, dict):
             if _is_plural_dict(value):
                 full_path = ".".join(map(str, path))
@@ -182,40 +202,50 @@ class LocaleTranslator:
                     func=self._create_plural_handler(path, value, found_locale_code),
                     path=full_path,
                     strict=self._strict,
+                    locale_code=self.locale_code,
                 )
             else:
                 return NamespaceWrapper(path, self)
         elif isinstance(value, list):
             return ListWrapper(value, path, self)
+        elif isinstance(value, CompiledPlural):
+            return PluralWrapper(
+                func=self._create_compiled_plural_handler(path, value, found_locale_code),
+                path=".".join(map(str, path)),
+                strict=self._strict,
+                locale_code=self.locale_code,
+            )
+        elif isinstance(value, CompiledMessage):
+            return self._bind_message(value)
         else:
-            if callable(value):
-                # noinspection PyUnresolvedReferences
-                value.bind(self)
-
             return value
 
+    def _bind_message(self, message: CompiledMessage) -> BoundMessage:
+        """Return the cached view of a compiled message bound to this translator."""
+        bound = self._bound_messages.get(message)
+        if bound is None:
+            bound = self._bound_messages.setdefault(message, message.bind(self))
+
+        return bound
+
     def _create_plural_handler(
         self, path: list, plural_dict: dict[str, Any], found_locale_code: str | None
-    ) -> Callable:
+    ) -> Callable[..., str]:
         """Create the callable plural handler."""
 
-        def plural_handler(count: int, **kwargs) -> str:
+        def plural_handler(count: int | float | Decimal | str, **kwargs) -> str:
             """
             Return handler for plural localization keys.
 
             Format the appropriate plural template based on the count.
+            Fractional counts (1.5, Decimal("1.0"), "0.50") select the CLDR form for their visible digits.
             """
-            if not isinstance(count, int):
-                raise TypeError(
-                    f"Plural handler for key '{'.'.join(map(str, path))}' "
-                    f"requires an integer count, not {type(count).__name__}"
-                )
-
-            template = self._get_plural_template(path, count, plural_dict, found_locale_code)
+            operand = self._plural_count_operand(path, count)
+            template = self._get_plural_template(path, operand, plural_dict, found_locale_code)
 
             full_key_path_str = ".".join(map(str, path))
             if template is None:
-                form_key = self._get_plural_form_key(count, found_locale_code)
+                form_key = self._get_plural_form_key(operand, found_locale_code)
                 raise AttributeError(
                     f"Failed to find plural template for key '{full_key_path_str}' "
                     f"(form '{form_key}', count {count}) in locale '{found_locale_code or self.locale_code}' "
@@ -225,19 +255,77 @@ class LocaleTranslator:
             format_args = {"count": count}
             format_args.update(kwargs)
             try:
-                return StringWrapper(template)(**format_args)
+                return StringWrapper(template, self.locale_code)(**format_args)
             except KeyError as e:
-                form_key = self._get_plural_form_key(count, found_locale_code)
+                form_key = self._get_plural_form_key(operand, found_locale_code)
                 raise ValueError(
                     f"Formatting error for plural key '{full_key_path_str}' (form '{form_key}'): "
                     f"Missing placeholder {e} in template '{template}'"
                 )
             except AttributeError:
-                form_key = self._get_plural_form_key(count, found_locale_code)
+                form_key = self._get_plural_form_key(operand, found_locale_code)
                 raise ValueError(f"Error: Template for key '{full_key_path_str}' form '{form_key}' is not a string.")
 
         return plural_handler
 
+    def _create_compiled_plural_handler(
+        self, path: list, message: CompiledPlural, found_locale_code: str | None
+    ) -> Callable:
+        """
+        Create the plural handler for a plural dict compiled by the loader.
+
+        The message is rendered by the ICU engine, with the plural rules of the locale it was found in.
+        Calls the engine can't render the same way as the dict handler (missing forms, missing
+        placeholders) are passed to the dict handler, so the forms and errors stay the same.
+        """
+        dict_handler = self._create_plural_handler(path, message.forms, found_locale_code)
+        translator = self if found_locale_code in (None, self.locale_code) else self._get_default_translator()
+        node = message.node
+        others = tuple(name for name in message.signature.names if name != node.name)
+
+        def plural_handler(count: int | float | Decimal | str, **kwargs) -> str:
+            """Render the compiled plural message for the count."""
+            operand = self._plural_count_operand(path, count)
+            if (
+                node.fallback is None
+                and operand not in node.exact
+                and self._get_plural_form_key(operand - node.offset, found_locale_code) not in node.categories
+            ):
+                return dict_handler(count, **kwargs)
+
+            for name in others:
+                if name not in kwargs:
+                    return dict_handler(count, **kwargs)
+
+            kwargs[node.name] = count
+            return message.render(translator, None, **kwargs)
+
+        return plural_handler
+
+    def _get_default_translator(self) -> "LocaleTranslator":
+        """Return a translator of the default locale, to render messages found there by its rules."""
+        if (translator := self._default_translator) is None:
+            translator = self._default_translator = LocaleTranslator(
+                self._default_locale_code,
+                self._default_data,
+                self._default_data,
+                self._default_locale_code,
+                strict=self._strict,
+            )
+
+        return translator
+
+    def _plural_count_operand(self, path: list, count: Any) -> int | Decimal:
+        """Convert a plural count to a CLDR operand, or raise TypeError if it's not numeric."""
+        if type(count) is int:
+            return count
+        elif isinstance(count, (int, float, Decimal, str)):
+            return _plural_operand(count)
+
+        raise TypeError(
+            f"Plural handler for key '{'.'.join(map(str, path))}' requires a numeric count, not {type(count).__name__}"
+        )
+
     def _resolve_value_by_path(self, path: list) -> Any:
         """
         Retrieve and process a value given its full path.
@@ -253,8 +341,9 @@ class LocaleTranslator:
         value, found_locale_code = self._get_value_by_path(path)
 
         if value is _NOT_FOUND:
-            full_key_path = ".".join(map(str, path))
+            key_path = DottedPath(path)
             if self._strict:
+                full_key_path = str(key_path)
                 if path and isinstance(path[-1], int):
                     raise IndexError(
                         f"Index out of bounds or path invalid for path '{full_key_path}' "
@@ -266,11 +355,16 @@ class LocaleTranslator:
                         f"in translations (including default '{self._default_locale_code}')."
                     )
             else:
-                self._logger.warning(
-                    f"key/index path '{full_key_path}' not found "
-                    f"in translations (including default '{self._default_locale_code}'). None will be returned."
+                diagnostics.record(
+                    "missing_key",
+                    self.locale_code,
+                    key_path,
+                    "key/index path '%s' not found in translations (including default '%s'). None will be returned.",
+                    key_path,
+                    self._default_locale_code,
+                    source=self._logger,
                 )
-                return NoneWrapper(self.locale_code, full_key_path)
+                return NoneWrapper(self.locale_code, key_path)
 
         return self._handle_resolved_value(value, path, found_locale_code)
 
@@ -308,10 +402,17 @@ class LocaleTranslator:
                     f"(looked in current '{self.locale_code}' and default '{self._default_locale_code}')."
                 )
             else:
-                self._logger.warning(
-                    f"Index '{i}' out of bounds for path '{full_key_path}' "
-                    f"(looked in current '{self.locale_code}' and default '{self._default_locale_code}'). "
-                    "None will be returned."
+                diagnostics.record(
+                    "missing_key",
+                    self.locale_code,
+                    full_key_path,
+                    "Index '%s' out of bounds for path '%s' (looked in current '%s' and default '%s'). "
+                    "None will be returned.",
+                    i,
+                    full_key_path,
+                    self.locale_code,
+                    self._default_locale_code,
+                    source=self._logger,
                 )
                 return NoneWrapper(self.locale_code, full_key_path)
 
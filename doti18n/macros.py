@@ -0,0 +1,109 @@
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from .errors import MacroError
+
+# keys macros are defined under, in any dict of a locale file
+MACRO_KEYS = ("__macros__", "__doti18n__")
+
+
+def _trie_pattern(names: Iterable[str]) -> str:
+    """
+    Build a regex matching any of `names`, preferring the longest one.
+
+    Names are merged into a trie, so a match costs one step per character
+    instead of one attempt per name.
+    """
+    trie: dict = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # greedy, so longer names are tried first
+        return f"(?:{pattern})?" if terminal else pattern
+
+    return build(trie)
+
+
+class Macros:
+    """
+    Macros of a scope, compiled for single-pass expansion.
+
+    All names are matched by one regex, longest name first, so `@app` never clobbers
+    `@app_name`, and each string is expanded in one scan whatever the number of macros.
+    Values may reference other macros. They are expanded once, when compiled.
+    """
+
+    __slots__ = ("values", "_pattern", "_replace")
+
+    def __init__(self, macros: Mapping[str, Any], parent: "Macros | None" = None):
+        """
+        Compile macros.
+
+        :param macros: Macro name -> value.
+        :param parent: Macros of the enclosing scope. They are available too, unless overridden.
+        :raises MacroError: If a macro is invalid, or macros reference each other in a cycle.
+        """
+        raw: dict[str, str] = {}
+        for name, value in macros.items():
+            if not isinstance(name, str) or not name:
+                raise MacroError(f"Macro names must be non-empty strings, got {name!r}.")
+            if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                raise MacroError(f"Value of macro '{name}' must be a string, got {type(value).__name__}.")
+            raw[name] = str(value)
+
+        values = {name: value for name, value in parent.values.items() if name not in raw} if parent else {}
+        pattern = re.compile("@(" + _trie_pattern([*values, *raw]) + ")") if values or raw else None
+        resolving: list[str] = []
+
+        def resolve(name: str) -> str:
+            if name in values:
+                return values[name]
+            if name in resolving:
+                cycle = " -> ".join(f"@{item}" for item in (*resolving[resolving.index(name) :], name))
+                raise MacroError(f"Macros reference each other in a cycle: {cycle}.")
+
+            resolving.append(name)
+            value = raw[name]
+            if pattern is not None and "@" in value:
+                value = pattern.sub(lambda match: resolve(match[1]), value)
+            resolving.pop()
+            values[name] = value
+            return value
+
+        for name in raw:
+            resolve(name)
+
+        # name -> expanded value
+        self.values: dict[str, str] = values
+        self._pattern = pattern
+        self._replace = lambda match: values[match[1]]
+
+    def expand(self, string: str) -> str:
+        """
+        Replace the macros in a string.
+
+        :param string: The string to expand.
+        :return: The expanded string.
+        """
+        if self._pattern is None or "@" not in string:
+            return string
+
+        return self._pattern.sub(self._replace, string)
+
+    def __repr__(self) -> str:
+        """Return a representation of the Macros."""
+        return f"{self.__class__.__name__}({list(self.values)})"
+
+
+__all__ = ["MACRO_KEYS", "Macros"]
@@ -1,4 +1,5 @@
 import os
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
 _NOT_FOUND = object()
@@ -20,6 +21,41 @@ def _is_plural_dict(data: dict) -> bool:
     return any(key in data and isinstance(data[key], str) for key in plural_keys)
 
 
+def _plural_operand(count: Any) -> int | Decimal:
+    """
+    Convert a count to a number that CLDR plural rules can handle.
+
+    Floats and numeric strings become Decimals, so visible fraction digits
+    ("1.50", 0.0) are kept and the v, f and t operands are computed correctly.
+    Integers should not be passed here, they are already valid operands.
+
+    :param count: The count (float, Decimal, numeric string or an int-like object).
+    :return: The signed operand.
+    :raises ValueError: If the count is not a finite number.
+    :raises TypeError: If the count has an unsupported type.
+    """
+    if isinstance(count, Decimal):
+        operand = count
+    elif isinstance(count, float):
+        # repr() is the shortest string that round-trips, i.e. the digits the user sees
+        operand = Decimal(repr(count))
+    elif isinstance(count, str):
+        text = count.strip()
+        if text.isdecimal():
+            return int(text)
+        try:
+            operand = Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"Invalid count '{count}'.") from None
+    else:
+        return int(count)
+
+    if not operand.is_finite():
+        raise ValueError(f"Invalid count '{count}'.")
+
+    return operand
+
+
 def _get_value_by_path_single(path: list, data: list | dict | None) -> Any:
     """Retrieve a value by path from a single dictionary."""
     current_value = data
@@ -59,10 +95,26 @@ def _deep_merge(source: dict | None, destination: dict | None) -> None:
             destination[key] = value
 
 
+def _deep_merged(source: Any, destination: Any) -> Any:
+    """Return `destination` deep-merged with `source`, like `_deep_merge`, without modifying either of them."""
+    if not isinstance(source, dict) or not isinstance(destination, dict):
+        return destination
+
+    merged = dict(destination)
+    for key, value in source.items():
+        if key in merged and isinstance(value, dict) and isinstance(merged[key], dict):
+            merged[key] = _deep_merged(value, merged[key])
+        else:
+            merged[key] = value
+
+    return merged
+
+
 __all__ = [
     "_NOT_FOUND",
     "_get_value_by_path_single",
     "_is_plural_dict",
     "_get_locale_code",
     "_deep_merge",
+    "_deep_merged",
 ]
@@ -1,4 +1,3 @@
-import logging
 from typing import TYPE_CHECKING, Any, SupportsIndex, overload
 
 if TYPE_CHECKING:
@@ -13,13 +12,12 @@ class ListWrapper(list):
     to nested structures like `locale["en"].list[0].item`.
     """
 
-    __slots__ = ("_data", "_path", "_translator", "_strict", "_logger")
+    __slots__ = ("_data", "_path", "_translator", "_strict")
 
     def __init__(self, data: list[Any], path: list[str | int], translator: "doti18n.LocaleTranslator"):
         """Initialize a LocaleList."""
         self._data = data
         self._path = path
-        self._logger = logging.getLogger(f"{self.__class__.__name__}[{repr(translator.locale_code)}]")
         self._translator = translator
         self._strict = translator._strict
         super().__init__(data)
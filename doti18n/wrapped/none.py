@@ -1,4 +1,6 @@
-import logging
+from ..diagnostics import DottedPath, diagnostics
+
+_NOT_FOUND_MESSAGE = "key/index path '%s' not found in locale '%s'. None will be returned."
 
 
 class NoneWrapper:
@@ -8,26 +10,31 @@ class NoneWrapper:
     This class is designed to provide a fallback mechanism when a specific locale or
     path is not found during runtime. It primarily serves as a way to log warnings and
     return default values, such as `None`, for missing keys or attributes.
+    Warnings go through `doti18n.diagnostics`, so repeated misses are counted instead of logged every time.
     """
 
-    __slots__ = ("_path", "_locale_code", "_logger")
+    __slots__ = ("_path", "_locale_code")
 
-    def __init__(self, locale_code: str, path: str):
+    def __init__(self, locale_code: str, path: str | DottedPath):
         """Initialize an instance of the class with a given locale code and path."""
-        self._path = path
-        self._logger = logging.getLogger(f"{self.__class__.__name__}[{repr(locale_code)}]")
+        self._path = path if isinstance(path, DottedPath) else DottedPath((path,))
         self._locale_code = locale_code
 
+    def _report(self, kind: str, path: DottedPath):
+        diagnostics.record(
+            kind, self._locale_code, path, _NOT_FOUND_MESSAGE, path, self._locale_code, source="NoneWrapper"
+        )
+
     def __call__(self, *args, **kwargs):
         """Log a warning and return None."""
-        self._logger.warning(f"key/index path '{self._path}' not found. None will be returned.")
+        self._report("none_used", self._path)
         return None
 
     def __getattr__(self, name: str):
         """Log a warning and return None."""
-        full_key_path = ".".join([self._path, name])
-        self._logger.warning(f"key/index path '{full_key_path}' not found. " "None will be returned.")
-        return NoneWrapper(self._locale_code, f"{self._path}.{name}")
+        path = DottedPath((*self._path, name))
+        self._report("missing_key", path)
+        return NoneWrapper(self._locale_code, path)
 
     def __bool__(self):
         """Return False."""
@@ -39,12 +46,12 @@ class NoneWrapper:
 
     def __iter__(self):
         """Log a warning and return an empty iterator."""
-        self._logger.warning(f"key/index path '{self._path}' not found. None will be returned.")
+        self._report("none_used", self._path)
         return iter([])
 
     def __str__(self):
         """Log a warning and return None."""
-        self._logger.warning(f"key/index path '{self._path}' not found. None will be returned.")
+        self._report("none_used", self._path)
         return "None"
 
     def __repr__(self):
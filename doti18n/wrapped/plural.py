@@ -1,18 +1,19 @@
-import logging
 from collections.abc import Callable
 
+from ..diagnostics import diagnostics
+
 
 class PluralWrapper:
     """Wrap a plural handler function to make it callable."""
 
-    __slots__ = ("func", "path", "strict", "_logger")
+    __slots__ = ("func", "path", "strict", "locale_code")
 
-    def __init__(self, func: Callable, path: str, strict: bool = False):
-        """Initialize an instance with the provided function, path, and strictness flag."""
+    def __init__(self, func: Callable, path: str, strict: bool = False, locale_code: str | None = None):
+        """Initialize an instance with the provided function, path, strictness flag and locale code."""
         self.func = func
         self.path = path
         self.strict = strict
-        self._logger = logging.getLogger(self.__class__.__name__)
+        self.locale_code = locale_code
 
     def __call__(self, *args, **kwargs):
         """Call the wrapped plural handler function."""
@@ -28,4 +29,5 @@ class PluralWrapper:
         if self.strict:
             raise TypeError(msg)
 
-        self._logger.warning(msg)
+        diagnostics.record("plural_as_string", self.locale_code, self.path, msg, source="PluralWrapper")
+        return ""
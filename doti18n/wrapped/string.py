@@ -1,5 +1,8 @@
-import logging
 import re
+from functools import lru_cache
+from string import Formatter
+
+from ..diagnostics import diagnostics
 
 PLACEHOLDER_REGEX = re.compile(
     r"""
@@ -14,19 +17,71 @@ PLACEHOLDER_REGEX = re.compile(
     re.VERBOSE,
 )
 
+_FORMATTER = Formatter()
+
+
+@lru_cache(maxsize=4096)
+def _encode_static(template: str) -> bytes | None:
+    """Return the UTF-8 encoded string, if it has no replacement fields, or None."""
+    try:
+        parts = list(_FORMATTER.parse(template))
+    except ValueError:
+        return None
+    if any(field_name is not None for _, field_name, _, _ in parts):
+        return None
+
+    return "".join(literal for literal, _, _, _ in parts).encode("utf-8")
+
 
 class StringWrapper(str):
     """A wrapper for a string value, which allows you to format strings by calling magic function `__call__`."""
 
+    locale_code: str | None = None
+
+    def __new__(cls, value: object = "", locale_code: str | None = None):
+        """
+        Create the wrapper.
+
+        :param value: The string.
+        :param locale_code: The locale the string belongs to, for diagnostics.
+        """
+        string = super().__new__(cls, value)
+        if locale_code is not None:
+            string.locale_code = locale_code
+        return string
+
     def __call__(self, *args, **kwargs) -> str:
         """Format the string using the provided arguments and keyword arguments."""
         try:
             return self.format(*args, **kwargs)
         except Exception as e:
-            logging.getLogger(self.__class__.__name__).warning(
-                f"Failed to format string '{self}' with args {args} and kwargs {kwargs}. "
-                f"Error: {e.__class__.__name__}: {e}"
+            diagnostics.record(
+                "format_error",
+                self.locale_code,
+                str(self),
+                "Failed to format string '%s' with args %s and kwargs %s. Error: %s: %s",
+                self,
+                args,
+                kwargs,
+                e.__class__.__name__,
+                e,
+                source="StringWrapper",
             )
             temp = "".join(re.split(r"\{.*}", self))
             temp = temp.replace("{{", "{").replace("}}", "}")
             return temp
+
+    def render_bytes(self, *args, **kwargs) -> bytes:
+        """
+        Format the string like `__call__`, but return UTF-8 encoded bytes.
+
+        Strings without replacement fields are encoded once and cached.
+        """
+        if (encoded := _encode_static(self)) is not None:
+            return encoded
+
+        try:
+            return self.format(*args, **kwargs).encode("utf-8")
+        except Exception:
+            # let __call__ deal with logging and the fallback
+            return self(*args, **kwargs).encode("utf-8")
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from doti18n import LocaleData
+from doti18n.loaders import D18nLoader
+
+SOURCES = {
+    "en": {"greet": "Hello, {name}!", "cats": "icu:{count, plural, one {# cat} other {# cats}}"},
+    "fr": {"greet": "Bonjour, {name} !", "cats": "icu:{count, plural, one {# chat} other {# chats}}"},
+}
+
+
+@pytest.fixture
+def compiled_dir(tmp_path):
+    """Compile the sources into a directory of `.d18n` catalogs, like `doti18n compile` does."""
+    source, output = tmp_path / "source", tmp_path / "compiled"
+    source.mkdir()
+    output.mkdir()
+    for locale_code, data in SOURCES.items():
+        (source / f"{locale_code}.json").write_text(json.dumps(data), encoding="utf-8")
+
+    for locale_code, data in LocaleData(source, strict=True)._raw_translations.items():
+        D18nLoader.save(output / f"{locale_code}.d18n", data)
+    return output
+
+
+@pytest.mark.parametrize("workers, executor", [(None, "thread"), (2, "thread"), (2, "process")])
+def test_compiled_catalogs_load_with_every_executor(compiled_dir, workers, executor):
+    """Catalogs are loaded in this process, so their messages are run by its engine with any executor."""
+    i18n = LocaleData(compiled_dir, strict=True, workers=workers, executor=executor)
+    assert i18n["en"].greet(name="Bob") == "Hello, Bob!"
+    assert i18n["en"].cats(count=2) == "2 cats"
+    assert i18n["fr"].cats(count=1) == "1 chat"
@@ -0,0 +1,36 @@
+import pytest
+from babel.lists import format_list
+from babel.localedata import locale_identifiers
+
+from doti18n.icumf.formatters.list import LIST_TYPES, LIST_WIDTHS, compile_list_format
+
+STYLES = [list_type + width for list_type in LIST_TYPES for width in LIST_WIDTHS]
+ITEMS = [f"i{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("style", STYLES)
+def test_list_format_matches_babel(style):
+    """Lists of every style and width are joined like Babel joins them, in every locale."""
+    list_type, _, width = style.partition("-")
+    babel_style = LIST_TYPES[list_type] + (f"-{width}" if width else "")
+    for locale_code in locale_identifiers():
+        compiled = compile_list_format(locale_code, style)
+        for count in range(len(ITEMS) + 1):
+            try:
+                expected = format_list(ITEMS[:count], babel_style, locale_code)
+            except (KeyError, ValueError):
+                # Babel takes all patterns from one style, and fails if it's incomplete
+                continue
+            if any(expected.count(item) != 1 for item in ITEMS[:count]):
+                # Babel repeats the last item of a pair if the style has no `2` pattern
+                continue
+            assert compiled.format(ITEMS[:count]) == expected, (locale_code, style, count)
+
+
+@pytest.mark.parametrize(
+    "locale_code, expected",
+    [("fr", "i0, i1 et i2"), ("de", "i0, i1 und i2"), ("fi", "i0, i1 ja i2")],
+)
+def test_unit_list_inherits_missing_patterns(locale_code, expected):
+    """Patterns a locale doesn't define for a style are inherited one by one."""
+    assert compile_list_format(locale_code, "unit").format(ITEMS[:3]) == expected